@@ -3,7 +3,9 @@ This module provides initialization logic for chatbot bots by configuring
 and creating Chatbot instances using the provided conversation configuration.
 """
 
-from typing import List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import ClassVar, Dict, List, Optional, Set, Tuple, Type
 
 from chatbot_conversation.conversation.loader import ConversationConfig
 from chatbot_conversation.conversation.prompt import construct_system_prompt
@@ -16,26 +18,80 @@ from chatbot_conversation.models import (
     ChatbotParamsOpt,
 )
 
+# Identifies a bot by everything it is constructed from: name, type, version,
+# system prompt, temperature and max tokens
+_BotKey = Tuple[str, str, str, str, Optional[float], Optional[int]]
+
+# Most bots kept for reuse, least recently used bots are evicted beyond this
+BOT_CACHE_SIZE = 64
+
 
 class BotsInitializer:
     """
     Initializes and manages the creation of Chatbot instances.
     """
 
+    # Bots built with reuse_bots by any initializer in least recently used order,
+    # shared so a config can be initialised again
+    _bot_cache: ClassVar["OrderedDict[_BotKey, ChatbotBase]"] = OrderedDict()
+
     def __init__(self) -> None:
 
         self.bot_registry = BotRegistry()  # get the singleton instance
         self.factory = ChatbotFactory(self.bot_registry)
 
-    def initialize_bots(self, config: ConversationConfig) -> List[ChatbotBase]:
+    def initialize_bots(
+        self, config: ConversationConfig, reuse_bots: bool = False
+    ) -> List[ChatbotBase]:
         """
         Create and return a list of ChatbotBase objects based on the conversation config.
+
+        Bot names are unique per process, so by default initialising the same
+        config again fails because the bot names are already in use. With
+        reuse_bots, bots are kept in a process-wide cache and initialising the
+        same config again with reuse_bots returns the bots already built for it,
+        with their format caches cleared. Reused bots are shared with every
+        earlier caller, so two conversations using them must not run at the
+        same time.
+
+        Args:
+            config (ConversationConfig): The conversation configuration
+            reuse_bots (bool): Whether to reuse, and keep for reuse, bots with an
+                identical configuration. Defaults to False
+
+        Returns:
+            List[ChatbotBase]: The bots in configuration order
         """
         bots: List[ChatbotBase] = []
 
+        prefetch_errors = self._prefetch_available_versions(config)
+
+        # Bind loop invariants once rather than resolving them for every bot
+        create_bot = self.factory.create_bot
+        core_prompt = config.core_prompt
+
         for bot_config in config.bots:
             # Construct the system prompt for the bot
-            bot_system_prompt = construct_system_prompt(config.core_prompt, bot_config)
+            bot_system_prompt = construct_system_prompt(core_prompt, bot_config)
+
+            key: _BotKey = (
+                bot_config.bot_name,
+                bot_config.bot_type.upper(),
+                bot_config.bot_version,
+                bot_system_prompt,
+                bot_config.bot_params_opt.temperature,
+                bot_config.bot_params_opt.max_tokens,
+            )
+            if reuse_bots:
+                cached_bot = self._get_cached_bot(key)
+                if cached_bot is not None:
+                    bots.append(cached_bot)
+                    continue
+
+            # Raise a failed version lookup rather than repeat it creating the bot
+            prefetch_error = prefetch_errors.get(bot_config.bot_type.upper())
+            if prefetch_error is not None:
+                raise prefetch_error
 
             # Create ChatbotConfig object
             chatbot_config = ChatbotConfig(
@@ -51,10 +107,84 @@ class BotsInitializer:
                 ),
             )
 
-            bot = self.factory.create_bot(chatbot_config)
+            bot = create_bot(chatbot_config)
+            if reuse_bots:
+                self._cache_bot(key, bot)
             bots.append(bot)
         return bots
 
+    def _get_cached_bot(self, key: _BotKey) -> Optional[ChatbotBase]:
+        """
+        Return the bot previously built for a configuration, if still usable.
+
+        A cached bot is only reused while it still holds its name, so bots are
+        rebuilt after the registered names have been reset. A reused bot starts
+        with an empty format cache, as it is about to join a new conversation.
+
+        Args:
+            key (_BotKey): The bot's construction parameters
+
+        Returns:
+            Optional[ChatbotBase]: The cached bot, or None if it must be built
+        """
+        bot = self._bot_cache.get(key)
+        if bot is None or not ChatbotBase.is_name_in_use(bot.name):
+            return None
+        self._bot_cache.move_to_end(key)
+        bot.clear_format_cache()
+        return bot
+
+    def _cache_bot(self, key: _BotKey, bot: ChatbotBase) -> None:
+        """
+        Keep a newly built bot for reuse, evicting the least recently used bot
+        once the cache holds BOT_CACHE_SIZE bots.
+
+        Args:
+            key (_BotKey): The bot's construction parameters
+            bot (ChatbotBase): The bot built from them
+        """
+        self._bot_cache[key] = bot
+        self._bot_cache.move_to_end(key)
+        if len(self._bot_cache) > BOT_CACHE_SIZE:
+            self._bot_cache.popitem(last=False)
+
+    def _prefetch_available_versions(self, config: ConversationConfig) -> Dict[str, BaseException]:
+        """
+        Fetch the available model versions of each distinct bot class concurrently.
+
+        Version lookups are independent network calls cached per class, so running
+        them together overlaps their latency. Bots themselves are still created in
+        config order so bot indices are unchanged. A failed lookup is not cached by
+        its bot class, so its error is returned to be raised in place of creating
+        the bot rather than repeating the lookup.
+
+        Args:
+            config (ConversationConfig): The conversation configuration
+
+        Returns:
+            Dict[str, BaseException]: Errors from failed lookups, keyed by upper
+                case bot type
+        """
+        bot_types: Dict[Type[ChatbotBase], Set[str]] = {}
+        for bot_config in config.bots:
+            if self.factory.is_bot_registered(bot_config.bot_type):
+                bot_class = self.bot_registry.get_bot_class(bot_config.bot_type)
+                bot_types.setdefault(bot_class, set()).add(bot_config.bot_type.upper())
+        if len(bot_types) < 2:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=len(bot_types)) as executor:
+            futures = {
+                bot_class: executor.submit(bot_class.available_versions) for bot_class in bot_types
+            }
+
+        errors: Dict[str, BaseException] = {}
+        for bot_class, future in futures.items():
+            error = future.exception()
+            if error is not None:
+                errors.update(dict.fromkeys(bot_types[bot_class], error))
+        return errors
+
     def get_bot_registry(self) -> BotRegistry:
         """
         Returns the bot registry instance.
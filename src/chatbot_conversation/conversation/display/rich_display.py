@@ -1,15 +1,85 @@
 """Rich-based implementation of display interface."""
 
-import os
-from typing import Any, Iterator
+from functools import lru_cache
+from typing import Any, Iterator, List, Optional
 
-from rich.console import Console
+from rich.console import Console, ConsoleOptions, RenderResult
 from rich.live import Live
 from rich.markdown import Markdown
 
 from .abstract_display import DisplayInterface
 
 
+@lru_cache(maxsize=64)
+def _markdown(text: str) -> Markdown:
+    """Parse text as markdown, reusing the result for repeated text.
+
+    Separators and headings are shown many times per conversation, parsing
+    them once avoids rebuilding the same markdown document on every print.
+
+    Args:
+        text: Markdown source text
+
+    Returns:
+        Parsed markdown renderable
+    """
+    return Markdown(text)
+
+
+class _StreamingMarkdown:
+    """Markdown renderable for text that grows while it is being displayed.
+
+    Chunks arrive much faster than the live display refreshes, so they are
+    collected in a list and only joined and parsed as markdown when rendered,
+    and then only if new chunks have arrived since the last render.
+
+    Used as the renderable of a rich Live display, which renders it on each
+    refresh through the rich console protocol.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no text received and nothing parsed yet."""
+        self._chunks: List[str] = []
+        self._parsed: Optional[Markdown] = None
+        self._parsed_count = 0  # number of chunks in the parsed markdown
+
+    def append(self, chunk: str) -> None:
+        """Add a chunk to the end of the text.
+
+        Args:
+            chunk: Text chunk received from the stream
+        """
+        self._chunks.append(chunk)
+
+    @property
+    def text(self) -> str:
+        """Text received so far.
+
+        Returns:
+            All chunks received so far joined together
+        """
+        return "".join(self._chunks)
+
+    def __rich_console__(self, _console: Console, _options: ConsoleOptions) -> RenderResult:
+        """Render the text received so far as markdown.
+
+        The markdown is parsed again only if chunks have arrived since the
+        last render, otherwise the previously parsed markdown is reused.
+
+        Args:
+            _console: Console being rendered to, unused
+            _options: Console render options, unused
+
+        Yields:
+            Parsed markdown renderable for the text so far
+        """
+        count = len(self._chunks)
+        if self._parsed is None or count != self._parsed_count:
+            self._parsed = Markdown("".join(self._chunks[:count]))
+            self._parsed_count = count
+        yield self._parsed
+
+
 class RichDisplay(DisplayInterface):
     """Rich library implementation of display interface."""
 
@@ -18,8 +88,12 @@ class RichDisplay(DisplayInterface):
         self.console = Console()
 
     def clear(self) -> None:
-        """Clear the terminal screen."""
-        os.system("cls" if os.name == "nt" else "clear")
+        """Clear the terminal screen.
+
+        Uses the console's ANSI clear and cursor home codes rather than
+        spawning a shell to run cls/clear, nothing is written if not a terminal.
+        """
+        self.console.clear()
 
     def show_text(self, text: str) -> None:
         """Display markdown formatted text.
@@ -27,7 +101,7 @@ class RichDisplay(DisplayInterface):
         Args:
             text: Text to display as markdown
         """
-        self.console.print(Markdown(f"{text}"))
+        self.console.print(_markdown(text))
 
     def show_streaming_text(self, text_generator: Iterator[Any]) -> str:
         """Display streaming text with live updates.
@@ -38,9 +112,9 @@ class RichDisplay(DisplayInterface):
         Returns:
             Complete text after all chunks processed
         """
-        current_text = ""
-        with Live(Markdown(current_text), refresh_per_second=4) as live:
+        streaming_text = _StreamingMarkdown()
+        with Live(streaming_text, console=self.console, refresh_per_second=4):
+            append = streaming_text.append
             for chunk in text_generator:
-                current_text += chunk
-                live.update(Markdown(current_text))
-        return current_text
+                append(chunk)
+        return streaming_text.text
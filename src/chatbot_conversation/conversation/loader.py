@@ -15,14 +15,17 @@ Classes:
     ConversationConfig: Configuration model for the entire conversation
 
 Functions:
-    load_conversation_config: Load and validate a conversation configuration from a JSON file
+    load_conversation_config: Load and validate a conversation configuration from a JSON file,
+        reusing the previous result while the file is unchanged
 """
 
 import json
+import os
 import re
 from collections import Counter
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Final, List, Optional, Union
 
 from pydantic import (
     BaseModel,
@@ -49,8 +52,59 @@ MAX_TEMPERATURE = 2.0
 ALLOWED_TEMPLATE_VARS = {"bot_name", "max_tokens"}
 TEMPLATE_VARS_PATTERN = r"\{([^}]+)\}"
 
+# Compiled once at import rather than on every validator call
+_BOT_NAME_RE = re.compile(BOT_NAME_PATTERN)
+_TEMPLATE_VARS_RE = re.compile(TEMPLATE_VARS_PATTERN)
+
 logger = get_logger(LOGNAME_CONVERSATION)
 
+_CONFIG_FILE_HINT: Final = ", please check conversation configuration file"
+
+
+def _config_validation_error(error_msg: str) -> ValidationException:
+    """Build the exception raised for an invalid conversation configuration.
+
+    Args:
+        error_msg: Description of the validation failure
+
+    Returns:
+        ValidationException: Exception whose user message points at the config file
+    """
+    return ValidationException(
+        message=error_msg,
+        user_message=error_msg + _CONFIG_FILE_HINT,
+        severity=ErrorSeverity.ERROR,
+        original_error=None,
+    )
+
+
+def _config_file_error(
+    config_path: Path, error: Exception
+) -> Union[ConfigurationException, SystemException]:
+    """Build the exception raised when a configuration file cannot be read.
+
+    Args:
+        config_path: Path of the configuration file
+        error: Error raised while checking or reading the file
+
+    Returns:
+        Union[ConfigurationException, SystemException]: Configuration error if the file
+            is missing, otherwise a system error
+    """
+    if isinstance(error, FileNotFoundError):
+        return ConfigurationException(
+            message=f"Configuration file not found: {config_path}",
+            user_message="The configuration file could not be found. Please check the file path.",
+            severity=ErrorSeverity.FATAL,
+            original_error=error,
+        )
+    return SystemException(
+        message=f"Error reading configuration: {str(error)}",
+        user_message="An unexpected error occurred while reading the configuration.",
+        severity=ErrorSeverity.FATAL,
+        original_error=error,
+    )
+
 
 class BaseConfigModel(BaseModel):
     """Base configuration model with strict validation."""
@@ -120,24 +174,11 @@ class ChatbotConfigData(BaseConfigModel):
         """
         if v.count("{") != v.count("}"):
             error_msg = "Mismatched template variable braces in bot_prompt"
-            raise ValidationException(
-                message=error_msg,
-                user_message=f"{error_msg}, please check conversation configuration file",
-                severity=ErrorSeverity.ERROR,
-                original_error=None,
-            )
-        allowed_vars = ALLOWED_TEMPLATE_VARS
-        template_vars = re.findall(TEMPLATE_VARS_PATTERN, v)
-        invalid_vars = set(template_vars) - allowed_vars
+            raise _config_validation_error(error_msg)
+        invalid_vars = set(_TEMPLATE_VARS_RE.findall(v)) - ALLOWED_TEMPLATE_VARS
         if invalid_vars:
-            raise ValidationException(
-                message=f"Invalid template variables in bot_prompt: {invalid_vars}",
-                user_message=(
-                    "Invalid template variables in bot_prompt: "
-                    f"{invalid_vars}, please check conversation configuration file"
-                ),
-                severity=ErrorSeverity.ERROR,
-                original_error=None,
+            raise _config_validation_error(
+                f"Invalid template variables in bot_prompt: {invalid_vars}"
             )
         return v
 
@@ -197,29 +238,11 @@ class ConversationConfig(BaseConfigModel):
             ValueError: If template variables are malformed or invalid
         """
         if v.count("{") != v.count("}"):
-            raise ValidationException(
-                message="Mismatched template variable braces in core_prompt",
-                user_message=(
-                    "Mismatched template variable braces in core_prompt,"
-                    "please check conversation configuration file"
-                ),
-                severity=ErrorSeverity.ERROR,
-                original_error=None,
-            )
+            raise _config_validation_error("Mismatched template variable braces in core_prompt")
 
-        allowed_vars = {"bot_name", "max_tokens"}
-        template_vars = re.findall(TEMPLATE_VARS_PATTERN, v)
-        invalid_vars = set(template_vars) - allowed_vars
+        invalid_vars = set(_TEMPLATE_VARS_RE.findall(v)) - ALLOWED_TEMPLATE_VARS
         if invalid_vars:
-            raise ValidationException(
-                message=f"Invalid template variables found: {invalid_vars}",
-                user_message=(
-                    f"Invalid template variables found: {invalid_vars}"
-                    ", please check conversation configuration file"
-                ),
-                severity=ErrorSeverity.ERROR,
-                original_error=None,
-            )
+            raise _config_validation_error(f"Invalid template variables found: {invalid_vars}")
         return v
 
     @field_validator("bots")
@@ -236,34 +259,23 @@ class ConversationConfig(BaseConfigModel):
         Raises:
             ValueError: If duplicate or invalid bot names are found
         """
-        bot_name_pattern = re.compile(BOT_NAME_PATTERN)
+        names: List[str] = [bot.bot_name for bot in v]
 
         # Check for invalid name formats
-        invalid_names = [bot.bot_name for bot in v if not bot_name_pattern.match(bot.bot_name)]
+        invalid_names = [name for name in names if not _BOT_NAME_RE.match(name)]
         if invalid_names:
             error_msg = (
                 f"Invalid bot names (must be alphanumeric with optional underscores, "
                 f"not starting/ending with underscore): {', '.join(invalid_names)}"
             )
-            raise ValidationException(
-                message=error_msg,
-                user_message=f"{error_msg}, please check conversation configuration file",
-                severity=ErrorSeverity.ERROR,
-                original_error=None,
-            )
+            raise _config_validation_error(error_msg)
 
         # Check for duplicates
-        names: List[str] = [bot.bot_name for bot in v]
         name_counts: Dict[str, int] = Counter(names)
         duplicates: List[str] = [name for name, count in name_counts.items() if count > 1]
         if duplicates:
             error_msg = f"Duplicate bot names found in configuration: {', '.join(duplicates)}"
-            raise ValidationException(
-                message=error_msg,
-                user_message=f"{error_msg}, please check conversation configuration file",
-                severity=ErrorSeverity.ERROR,
-                original_error=None,
-            )
+            raise _config_validation_error(error_msg)
         return v
 
     @field_validator("moderator_messages_opt")
@@ -289,12 +301,7 @@ class ConversationConfig(BaseConfigModel):
         total_rounds: Optional[int] = info.data.get("rounds")
         if total_rounds is None:
             error_msg = "Cannot validate moderator messages without total rounds"
-            raise ValidationException(
-                message=error_msg,
-                user_message=f"{error_msg}, please check conversation configuration file",
-                severity=ErrorSeverity.ERROR,
-                original_error=None,
-            )
+            raise _config_validation_error(error_msg)
         # Check round numbers are unique
         round_nums: List[int] = [msg.round_number for msg in v]
         round_counts: Dict[int, int] = Counter(round_nums)
@@ -304,15 +311,7 @@ class ConversationConfig(BaseConfigModel):
                 "Duplicate round numbers found in moderator messages: "
                 f"{', '.join(map(str, duplicates))}"
             )
-            # Just before the specific duplicated section:
-            # pylint: disable=duplicate-code
-            raise ValidationException(
-                message=error_msg,
-                user_message=f"{error_msg}, please check conversation configuration file",
-                severity=ErrorSeverity.ERROR,
-                original_error=None,
-            )
-            # pylint: enable=duplicate-code
+            raise _config_validation_error(error_msg)
         # Check round numbers don't exceed total rounds
         invalid_rounds: List[int] = [num for num in round_nums if num > total_rounds]
         if invalid_rounds:
@@ -320,15 +319,7 @@ class ConversationConfig(BaseConfigModel):
                 f"Round numbers exceed total rounds ({total_rounds}): "
                 f"{', '.join(map(str, invalid_rounds))}"
             )
-            # Just before the specific duplicated section:
-            # pylint: disable=duplicate-code
-            raise ValidationException(
-                message=error_msg,
-                user_message=f"{error_msg}, please check conversation configuration file",
-                severity=ErrorSeverity.ERROR,
-                original_error=None,
-            )
-            # pylint: enable=duplicate-code
+            raise _config_validation_error(error_msg)
 
         return v
 
@@ -337,6 +328,11 @@ class ConversationConfig(BaseConfigModel):
 def load_conversation_config(config_path: Path) -> ConversationConfig:
     """Load and validate a conversation configuration from a JSON file.
 
+    The result is cached while the file is unchanged, so repeated calls return
+    the same ConversationConfig instance. The model is frozen but its list
+    fields (bots, moderator_messages_opt) are shared by every caller and must
+    not be mutated.
+
     Args:
         config_path: Must be a .json file
     """
@@ -349,17 +345,40 @@ def load_conversation_config(config_path: Path) -> ConversationConfig:
             original_error=None,
         )
 
+    # Validated configs are shared by all callers and reused until the file changes
+    try:
+        stat_result = os.stat(config_path)
+    except OSError as e:
+        raise _config_file_error(config_path, e) from e
+
+    # Keyed on the absolute path so a relative path is not reused across directories
+    return _load_conversation_config_cached(
+        Path(os.path.abspath(config_path)), stat_result.st_mtime_ns, stat_result.st_size
+    )
+
+
+@lru_cache(maxsize=32)
+def _load_conversation_config_cached(
+    config_path: Path, mtime_ns: int, size: int
+) -> ConversationConfig:
+    """Read and validate a configuration file, cached by path, mtime and size.
+
+    Exceptions are not cached, so an invalid file is re-read on the next call.
+
+    Args:
+        config_path: Path to the .json configuration file
+        mtime_ns: File modification time in nanoseconds (cache key only)
+        size: File size in bytes (cache key only)
+
+    Returns:
+        ConversationConfig: The validated configuration
+    """
+    del mtime_ns, size  # only used as cache key
+
     # Load and validate configuration
     try:
         with open(config_path, "r", encoding="utf-8") as f:
             data = json.load(f)
-    except FileNotFoundError as e:
-        raise ConfigurationException(
-            message=f"Configuration file not found: {config_path}",
-            user_message="The configuration file could not be found. Please check the file path.",
-            severity=ErrorSeverity.FATAL,
-            original_error=e,
-        ) from e
     except json.JSONDecodeError as e:
         raise ConfigurationException(
             message=f"Invalid JSON in configuration file: {str(e)} at position {e.pos}",
@@ -368,15 +387,12 @@ def load_conversation_config(config_path: Path) -> ConversationConfig:
             original_error=e,
         ) from e
     except Exception as e:
-        raise SystemException(
-            message=f"Error reading configuration: {str(e)}",
-            user_message="An unexpected error occurred while reading the configuration.",
-            severity=ErrorSeverity.FATAL,
-            original_error=e,
-        ) from e
+        raise _config_file_error(config_path, e) from e
 
     try:
-        config = ConversationConfig(**data)
+        # model_validate hands the parsed data straight to pydantic-core rather
+        # than unpacking it into keyword arguments first
+        config = ConversationConfig.model_validate(data)
         return config
     except ValidationError as e:
         raise ValidationException(
@@ -11,14 +11,20 @@ Classes:
 """
 
 import json
+import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from chatbot_conversation.conversation.bots_initializer import BotsInitializer
 from chatbot_conversation.conversation.display import create_display
-from chatbot_conversation.conversation.loader import load_conversation_config
+from chatbot_conversation.conversation.loader import (
+    ModeratorMessage,
+    load_conversation_config,
+)
 from chatbot_conversation.conversation.transcript import save_transcript
-from chatbot_conversation.models.base import ChatbotBase, ConversationMessage
+from chatbot_conversation.models.base import ChatbotBase
+from chatbot_conversation.models.messages import ConversationMessage
 from chatbot_conversation.utils import (
     LOGNAME_CONVERSATION,
     ErrorSeverity,
@@ -29,10 +35,30 @@ from chatbot_conversation.utils import (
 )
 
 PRIVATE_CONTENT_SEPARATOR = "PR1V4T3: "
+SECTION_SEPARATOR = "\n\n---\n\n"
 
 logger = get_logger(LOGNAME_CONVERSATION)
 
 
+@lru_cache(maxsize=1024)
+def _public_content(content: str) -> str:
+    """
+    Return the public part of message content, without any private content.
+
+    Every message is filtered again for each later bot turn, caching means the
+    content of each message is only split once.
+
+    Args:
+        content (str): The message content
+
+    Returns:
+        str: The content up to the private content separator, or all of it if none
+    """
+    if PRIVATE_CONTENT_SEPARATOR not in content:
+        return content
+    return content.split(PRIVATE_CONTENT_SEPARATOR, 1)[0].strip()
+
+
 class ConversationManager:
     """Manages conversation between multiple chatbots."""
 
@@ -54,6 +80,11 @@ class ConversationManager:
 
         self.config = load_conversation_config(self.config_path)
 
+        # Moderator messages keyed by round (config validation ensures at most one per round)
+        self._moderator_messages: Dict[int, ModeratorMessage] = {
+            msg.round_number: msg for msg in self.config.moderator_messages_opt
+        }
+
         self.bots: List[ChatbotBase] = []
 
         # This is the seed message with the bot index set to a dummy bot index value of 0
@@ -77,14 +108,14 @@ class ConversationManager:
         # Run conversation for configured number of rounds 1 to num_rounds
         for round_num in range(1, self.config.rounds + 1):
             self.display_manager.show_text(
-                f"## Round {round_num} of {self.config.rounds}\n\n---\n\n"
+                f"## Round {round_num} of {self.config.rounds}{SECTION_SEPARATOR}"
             )
             self.run_round(round_num)
 
         # Conversation completed
         completion_message = (
             f"## Conversation Finished - {self.config.rounds} Rounds With "
-            f"{len(self.bots)} Bots Completed!\n\n---\n\n"
+            f"{len(self.bots)} Bots Completed!{SECTION_SEPARATOR}"
         )
         self.display_manager.show_text(completion_message)
 
@@ -92,7 +123,7 @@ class ConversationManager:
 
         self.display_manager.show_text(
             "Conversation transcript and configuration data saved to: "
-            f"`{transcript_path}`\n\n---\n\n"
+            f"`{transcript_path}`{SECTION_SEPARATOR}"
         )
 
     def run_round(self, round_num: int) -> None:
@@ -102,15 +133,14 @@ class ConversationManager:
         logger.debug("Starting new conversation round")
 
         # Check for moderator message for this round
-        for moderator_msg in self.config.moderator_messages_opt:
-            if moderator_msg.round_number == round_num:
-                moderator_content = f"**Moderator**: {moderator_msg.content}"
-                # Always add to conversation history
-                self.conversation.append({"bot_index": 0, "content": moderator_content})
-                # Only display if display_opt is True
-                if moderator_msg.display_opt:
-                    self.display_manager.show_text(f"{moderator_content}\n\n---\n\n")
-                break  # Only one moderator message per round
+        moderator_msg = self._moderator_messages.get(round_num)
+        if moderator_msg is not None:
+            moderator_content = f"**Moderator**: {moderator_msg.content}"
+            # Always add to conversation history
+            self.conversation.append({"bot_index": 0, "content": moderator_content})
+            # Only display if display_opt is True
+            if moderator_msg.display_opt:
+                self.display_manager.show_text(f"{moderator_content}{SECTION_SEPARATOR}")
 
         # After checking for moderator, now run responses from all bots
         for bot in self.bots:
@@ -131,7 +161,7 @@ class ConversationManager:
 
             except (IndexError, KeyError, AttributeError, ValueError) as e:
                 raise ModelException(
-                    message=f"Data error in bot response: {str(e)}",
+                    message=f"Data error in bot response: {e}",
                     user_message=(
                         f"{bot.name}: an data error occurred, "
                         "please check the logs for more information."
@@ -143,17 +173,19 @@ class ConversationManager:
             # Store the complete response in conversation history
             self.conversation.append({"bot_index": bot.bot_index, "content": response})
 
-            # Log the conversation content for debugging
-            logger.debug(
-                "Bot Class: %s, Bot Name: %s, Bot Index: %s, Updated conversation: : %s",
-                bot.__class__.__name__,
-                bot.name,
-                bot.bot_index,
-                json.dumps(self.conversation, indent=2),
-            )
+            # Log the conversation content for debugging, serialising the whole
+            # history only when it will be emitted as it grows every turn
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Bot Class: %s, Bot Name: %s, Bot Index: %s, Updated conversation: : %s",
+                    bot.__class__.__name__,
+                    bot.name,
+                    bot.bot_index,
+                    json.dumps(self.conversation, indent=2),
+                )
 
             # Add separator after complete response
-            self.display_manager.show_text("\n\n---\n\n")
+            self.display_manager.show_text(SECTION_SEPARATOR)
         logger.info("Round completed successfully")
 
     def clean_truncated_response(self, response: str) -> str:
@@ -209,18 +241,13 @@ class ConversationManager:
             str: Filtered message content
         """
         content = message["content"]
-        parts = content.split(PRIVATE_CONTENT_SEPARATOR)
-
-        # If no private content, return original
-        if len(parts) == 1:
-            return content
 
         # Keep private content only if bot indices match
         if for_bot_index is not None and message["bot_index"] == for_bot_index:
             return content
 
         # Otherwise return only the public part
-        return parts[0].strip()
+        return _public_content(content)
 
     def get_filtered_conversation(self, bot_index: int) -> List[ConversationMessage]:
         """
@@ -9,7 +9,7 @@ from pathlib import Path
 from typing import List, Set, TextIO
 
 from chatbot_conversation.conversation.loader import ConversationConfig
-from chatbot_conversation.models.base import ConversationMessage
+from chatbot_conversation.models.messages import ConversationMessage
 from chatbot_conversation.utils import (
     ErrorSeverity,
     SystemException,
@@ -23,7 +23,7 @@ from chatbot_conversation.version import __version__
 
 # Update constants
 TRANSCRIPT_FILE_STUB: str = "transcript_"
-FILE_IN_PROJECT_ROOT: str = "pyproject.toml"  # Same as in env.py
+FILE_IN_PROJECT_ROOT: str = "pyproject.toml"  # Same as in utils/dir_util.py
 
 logger = get_logger("conversation")
 
@@ -28,6 +28,13 @@ LOGGER_MAPPING: Dict[Type[Exception], str] = {
     ValidationException: LOGNAME_VALIDATION,
 }
 
+# Exit status codes for ChatbotException severities
+EXIT_CODES: Dict[ErrorSeverity, int] = {
+    ErrorSeverity.WARNING: 1,
+    ErrorSeverity.ERROR: 2,
+    ErrorSeverity.FATAL: 3,
+}
+
 
 def handle_error(error: Exception) -> int:
     """
@@ -66,15 +73,10 @@ def handle_error(error: Exception) -> int:
         print(f"\nError: {error.user_message}")
 
         # Exit with appropriate code based on severity
-        exit_codes = {
-            ErrorSeverity.WARNING: 1,
-            ErrorSeverity.ERROR: 2,
-            ErrorSeverity.FATAL: 3,
-        }
-        return exit_codes[error.severity]
+        return EXIT_CODES[error.severity]
 
     # Unexpected error - log full details
-    logger.error("An unexpected error occurred: %s", str(error), exc_info=True)
+    logger.exception("An unexpected error occurred: %s", error)
     print(
         "\nAn unexpected error occurred please review the application logs for more information."
     )
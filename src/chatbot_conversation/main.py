@@ -2,14 +2,13 @@
 This module initializes and runs the chatbot conversation.
 """
 
-import logging
 import sys
 
 from chatbot_conversation.conversation import ConversationManager
 from chatbot_conversation.error import handle_error
-from chatbot_conversation.utils import LOGNAME_ROOT, APIConfig
+from chatbot_conversation.utils import LOGNAME_ROOT, APIConfig, get_logger
 
-logger = logging.getLogger(LOGNAME_ROOT)
+logger = get_logger(LOGNAME_ROOT)
 
 
 def main() -> None:
@@ -8,10 +8,10 @@ from chatbot_conversation.models.base import (
     ChatbotModel,
     ChatbotParamsOpt,
     ChatbotTimeout,
-    ConversationMessage,
 )
 from chatbot_conversation.models.bot_registry import BotRegistry
 from chatbot_conversation.models.factory import ChatbotFactory
+from chatbot_conversation.models.messages import ConversationMessage
 
 __all__ = [
     "ChatbotBase",
@@ -36,10 +36,13 @@ Implementation:
 """
 
 import json
+import logging
 import re
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, ClassVar, Final, Iterator, List, Optional, Set, Type, TypedDict
+from functools import partial
+from typing import Any, ClassVar, Dict, Final, Iterator, List, Optional, Set, Type
 
 from tenacity import (
     RetryError,
@@ -51,6 +54,12 @@ from tenacity import (
     wait_random_exponential,
 )
 
+from chatbot_conversation.models.messages import (
+    ChatMessage,
+    ConversationMessage,
+    FormattedHistory,
+    to_chat_message,
+)
 from chatbot_conversation.utils import (
     LOGNAME_MODELS,
     APIException,
@@ -98,33 +107,7 @@ DEFAULT_WAIT_MULTIPLIER: Final[float] = 1.5
 DEFAULT_MAX_TOKENS: Final[int] = 700
 
 
-class ChatMessage(TypedDict):
-    """
-    Message format for API communication.
-
-    Attributes:
-        role: Message source ('system', 'user', 'assistant')
-        content: Message text
-    """
-
-    role: str
-    content: str
-
-
-class ConversationMessage(TypedDict):
-    """
-    Internal message format for conversation tracking.
-
-    Attributes:
-        bot_index: Unique identifier of source bot
-        content: Message text
-    """
-
-    bot_index: int
-    content: str
-
-
-@dataclass
+@dataclass(slots=True)
 class ChatbotTimeout:
     """
     Configuration for API timeouts and retries.
@@ -146,7 +129,7 @@ class ChatbotTimeout:
     wait_multiplier: float = DEFAULT_WAIT_MULTIPLIER
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatbotParamsOpt:
     """
     Optional runtime parameters.
@@ -160,7 +143,7 @@ class ChatbotParamsOpt:
     max_tokens: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatbotModel:
     """
     Model configuration.
@@ -176,7 +159,7 @@ class ChatbotModel:
     params_opt: ChatbotParamsOpt = field(default_factory=ChatbotParamsOpt)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatbotConfig:
     """
     Chatbot instance configuration.
@@ -194,7 +177,7 @@ class ChatbotConfig:
     timeout: ChatbotTimeout = field(default_factory=ChatbotTimeout)
 
 
-@dataclass
+@dataclass(slots=True)
 class _Model:
     """
     Internal container for model-related attributes.
@@ -273,8 +256,10 @@ class ChatbotBase(ABC):
 
     # Class Variables
     _total_count: ClassVar[int] = 0
+    _total_count_lock: ClassVar[threading.Lock] = threading.Lock()
     _used_names: ClassVar[Set[str]] = set()
     _available_versions_cache: ClassVar[Optional[List[str]]] = None
+    _shared_model_apis: ClassVar[Dict[Type["ChatbotBase"], Any]] = {}
 
     _logger = get_logger(LOGNAME_MODELS)
 
@@ -304,6 +289,40 @@ class ChatbotBase(ABC):
         """
         return cls._total_count
 
+    @classmethod
+    def is_name_in_use(cls, name: str) -> bool:
+        """Return whether a bot has already been created with this name in this process."""
+        return name in cls._used_names
+
+    @classmethod
+    def _create_model_api(cls) -> Any:
+        """
+        Create the API client shared by all bots of this class, see _get_shared_model_api.
+
+        Responses are retried by generate_response and stream_response, so the
+        client should not add retries of its own for those calls.
+
+        Returns:
+            Any: A new API client
+
+        Raises:
+            NotImplementedError: If the bot class has no shared API client
+        """
+        raise NotImplementedError(f"{cls.__name__} does not share an API client")
+
+    @classmethod
+    def _get_shared_model_api(cls) -> Any:
+        """
+        Get the API client shared by all bots of this class, created on first use.
+
+        Returns:
+            Any: The API client from _create_model_api
+        """
+        api = cls._shared_model_apis.get(cls)
+        if api is None:
+            api = cls._shared_model_apis[cls] = cls._create_model_api()
+        return api
+
     @classmethod
     @abstractmethod
     def _get_class_model_type(cls) -> str:
@@ -571,8 +590,9 @@ class ChatbotBase(ABC):
         self._name: str = name
         self._used_names.add(self._name)
 
-        # Set system prompt
+        # Set system prompt, the API message for it is built once as it never changes
         self._system_prompt = config.system_prompt
+        self._system_message: ChatMessage = {"role": "system", "content": self._system_prompt}
 
         # Validate config model type against model implementation
         self._validate_model_type(config)
@@ -597,9 +617,18 @@ class ChatbotBase(ABC):
             max_tokens=max_tokens,
         )
 
-        # Initialize bot index and update class count
-        ChatbotBase._total_count += 1
-        self._bot_index: int = ChatbotBase._total_count
+        # Initialize bot index and update class count, the lock keeps indices
+        # unique if bots are constructed from several threads
+        with ChatbotBase._total_count_lock:
+            ChatbotBase._total_count += 1
+            self._bot_index: int = ChatbotBase._total_count
+
+        # Conversation messages already formatted for the API, see _format_conv_for_api_util
+        self._formatted_history: FormattedHistory[ChatMessage] = FormattedHistory()
+
+    def clear_format_cache(self) -> None:
+        """Discard messages already formatted for the API, before reusing the bot."""
+        self._formatted_history.clear()
 
     # Core Properties
     @property
@@ -716,18 +745,20 @@ class ChatbotBase(ABC):
             TimeoutError: If total response time exceeds configured timeout
         """
 
+        timeout = self.model_timeout
+
         # @retry around _inner_generate_response inside generate_response because
         # scope of self._should_retry_on_exception is not available to tenacity
         # when applied as a decorator to _generate_response directly
         @retry(
             stop=stop_any(
-                stop_after_attempt(self.model_timeout.max_retries),
-                stop_after_delay(self.model_timeout.total),
+                stop_after_attempt(timeout.max_retries),
+                stop_after_delay(timeout.total),
             ),
             wait=wait_random_exponential(
-                multiplier=self.model_timeout.wait_multiplier,
-                min=self.model_timeout.min_wait,
-                max=self.model_timeout.max_wait,
+                multiplier=timeout.wait_multiplier,
+                min=timeout.min_wait,
+                max=timeout.max_wait,
             ),
             retry=retry_if_exception(self._should_retry_on_exception),
         )
@@ -765,7 +796,7 @@ class ChatbotBase(ABC):
         except RetryError as e:
             if isinstance(e.last_attempt.exception(), TimeoutError):
                 raise APIException(
-                    message=f"Response generation timed out after {self.model_timeout.total}s",
+                    message=f"Response generation timed out after {timeout.total}s",
                     user_message=(
                         "A model took too long to respond, "
                         "please review the application log for more information."
@@ -775,8 +806,7 @@ class ChatbotBase(ABC):
                 ) from e
             raise APIException(
                 message=(
-                    f"Max retries ({self.model_timeout.max_retries}) "
-                    "exceeded during response generation"
+                    f"Max retries ({timeout.max_retries}) exceeded during response generation"
                 ),
                 user_message=(
                     "A model failed to generate a response after multiple attempts, "
@@ -828,15 +858,17 @@ class ChatbotBase(ABC):
             TimeoutError: If total streaming time exceeds configured timeout
         """
 
+        timeout = self.model_timeout
+
         @retry(
             stop=stop_any(
-                stop_after_attempt(self.model_timeout.max_retries),
-                stop_after_delay(self.model_timeout.total),
+                stop_after_attempt(timeout.max_retries),
+                stop_after_delay(timeout.total),
             ),
             wait=wait_random_exponential(
-                multiplier=self.model_timeout.wait_multiplier,
-                min=self.model_timeout.min_wait,
-                max=self.model_timeout.max_wait,
+                multiplier=timeout.wait_multiplier,
+                min=timeout.min_wait,
+                max=timeout.max_wait,
             ),
             retry=retry_if_exception(self._should_retry_on_exception),
         )
@@ -866,7 +898,7 @@ class ChatbotBase(ABC):
         except RetryError as e:
             if isinstance(e.last_attempt.exception(), TimeoutError):
                 raise APIException(
-                    message=f"Stream generation timed out after {self.model_timeout.total}s",
+                    message=f"Stream generation timed out after {timeout.total}s",
                     user_message=(
                         "The model stream took too long to respond, "
                         "please review the application log for more information."
@@ -875,10 +907,7 @@ class ChatbotBase(ABC):
                     original_error=e,
                 ) from e
             raise APIException(
-                message=(
-                    f"Max retries ({self.model_timeout.max_retries})"
-                    "exceeded during stream generation"
-                ),
+                message=f"Max retries ({timeout.max_retries}) exceeded during stream generation",
                 user_message=(
                     "The model stream failed after multiple attempts, "
                     "please review the application log for more information."
@@ -913,7 +942,8 @@ class ChatbotBase(ABC):
 
         Converts the internal conversation format to the structure expected by
         common chat APIs. Optionally includes the system prompt at the start
-        of the message list.
+        of the message list. Messages formatted by an earlier call are reused,
+        see FormattedHistory.
 
         Args:
             conversation (List[ConversationMessage]): List of conversation messages to format.
@@ -922,16 +952,14 @@ class ChatbotBase(ABC):
         Returns:
             List[ChatMessage]: List of formatted messages ready for API submission.
         """
+        history = self._formatted_history.update(
+            conversation, partial(to_chat_message, bot_index=self.bot_index)
+        )
+        messages = [self._system_message, *history] if add_system_prompt else list(history)
 
-        messages: List[ChatMessage] = []
-        if add_system_prompt:
-            messages.append({"role": "system", "content": self.system_prompt})
-
-        for contribution in conversation:
-            role = "assistant" if contribution["bot_index"] == self.bot_index else "user"
-            messages.append({"role": role, "content": contribution["content"]})
-
-        self._log_debug(json.dumps(messages, indent=2))
+        # Serialising the whole history is only worth doing if it will be logged
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._log_debug(json.dumps(messages, indent=2))
 
         return messages
 
@@ -9,16 +9,14 @@ Major Classes:
     ClaudeChatbot: Claude-specific chatbot implementation
 """
 
-from typing import Any, Iterator, List, Optional, Type
+from typing import Any, Final, Iterator, List, Optional, Type, cast
 
 import anthropic
+from anthropic.types import CacheControlEphemeralParam, MessageParam, TextBlockParam
 
-from chatbot_conversation.models.base import (
-    ChatbotBase,
-    ChatbotConfig,
-    ConversationMessage,
-)
+from chatbot_conversation.models.base import ChatbotBase, ChatbotConfig
 from chatbot_conversation.models.bot_registry import register_bot
+from chatbot_conversation.models.messages import ConversationMessage
 from chatbot_conversation.utils import APIException, ErrorSeverity
 
 # Default temperature for Claude models
@@ -29,6 +27,10 @@ CLAUDE_DEFAULT_TEMPERATURE = 1.0
 
 CLAUDE_MODEL_TYPE = "CLAUDE"
 
+# Marks a prompt prefix for Anthropic's prompt cache, prefixes below the model's
+# minimum cacheable length are simply not cached
+_EPHEMERAL_CACHE: Final[CacheControlEphemeralParam] = {"type": "ephemeral"}
+
 
 @register_bot(CLAUDE_MODEL_TYPE)
 class ClaudeChatbot(ChatbotBase):
@@ -56,9 +58,20 @@ class ClaudeChatbot(ChatbotBase):
 
     Attributes:
         Inherits all attributes from ChatbotBase plus:
-        _model_api (anthropic.Anthropic): Authenticated Claude API client
+        _model_api (anthropic.Anthropic): Authenticated Claude API client, shared
+            by all Claude bots
     """
 
+    @classmethod
+    def _create_model_api(cls) -> anthropic.Anthropic:
+        """
+        Create the Claude API client shared by all Claude bots.
+
+        Returns:
+            anthropic.Anthropic: Authenticated Claude API client without SDK retries
+        """
+        return anthropic.Anthropic(max_retries=0)
+
     @classmethod
     def available_versions(cls) -> Optional[List[str]]:
         """
@@ -73,9 +86,12 @@ class ClaudeChatbot(ChatbotBase):
         """
         if cls._available_versions_cache is None:
             try:
-                client = anthropic.Anthropic()
-                models = client.models.list()
-                cls._available_versions_cache = [model.id for model in models]
+                # Listing runs at start up outside the ChatbotBase retry loop,
+                # so transient errors are left to the SDK's default retries
+                client = cls._get_shared_model_api().with_options(
+                    max_retries=anthropic.DEFAULT_MAX_RETRIES
+                )
+                cls._available_versions_cache = [model.id for model in client.models.list()]
             except (anthropic.APIError, anthropic.APIConnectionError) as e:
                 error_msg = f"Failed to retrieve model versions from Claude API: {e}"
                 raise APIException(
@@ -140,8 +156,14 @@ class ClaudeChatbot(ChatbotBase):
         """
         super().__init__(config)
 
+        # The system prompt is fixed for the bot's lifetime, so it is sent as a
+        # cacheable block built once
+        self._system_blocks: List[TextBlockParam] = [
+            {"type": "text", "text": self.system_prompt, "cache_control": _EPHEMERAL_CACHE}
+        ]
+
         # Initialise Claude API
-        self._model_api = anthropic.Anthropic()
+        self._model_api = self._get_shared_model_api()
 
     def _generate_response(self, conversation: List[ConversationMessage]) -> str:
         """
@@ -164,8 +186,8 @@ class ClaudeChatbot(ChatbotBase):
         response_content: str = ""
         message = self._model_api.messages.create(
             model=self.model_version,
-            system=self.system_prompt,
-            messages=self._format_conv_for_api_util(conversation, add_system_prompt=False),
+            system=self._system_blocks,
+            messages=self._format_conv_for_claude_api(conversation),
             timeout=self.model_timeout.api_timeout,
             max_tokens=self.model_max_tokens,
             temperature=self.model_temperature,
@@ -173,6 +195,40 @@ class ClaudeChatbot(ChatbotBase):
         response_content = message.content[0].text
         return response_content
 
+    def _format_conv_for_claude_api(
+        self, conversation: List[ConversationMessage]
+    ) -> List[MessageParam]:
+        """
+        Format conversation history for Claude API submission.
+
+        The last message is marked as a prompt cache breakpoint. The history only
+        grows, so the next request from this bot starts with the same prefix and
+        Anthropic can serve it from the cache rather than reprocessing it.
+
+        Args:
+            conversation: Complete conversation history to format
+
+        Returns:
+            List[MessageParam]: Messages formatted for Claude API submission
+        """
+        # A new list of the shared formatted messages, so replacing its last entry is safe
+        messages = cast(
+            List[MessageParam],
+            self._format_conv_for_api_util(conversation, add_system_prompt=False),
+        )
+        if conversation:
+            messages[-1] = {
+                "role": messages[-1]["role"],
+                "content": [
+                    {
+                        "type": "text",
+                        "text": conversation[-1]["content"],
+                        "cache_control": _EPHEMERAL_CACHE,
+                    }
+                ],
+            }
+        return messages
+
     def _get_text_from_chunk(self, chunk: Any) -> str:
         """
         Extract text content from a streaming response chunk.
@@ -205,8 +261,8 @@ class ClaudeChatbot(ChatbotBase):
         """
         stream_manager = self._model_api.messages.stream(
             model=self.model_version,
-            system=self.system_prompt,
-            messages=self._format_conv_for_api_util(conversation, add_system_prompt=False),
+            system=self._system_blocks,
+            messages=self._format_conv_for_claude_api(conversation),
             timeout=self.model_timeout.api_timeout,
             max_tokens=self.model_max_tokens,
             temperature=self.model_temperature,
@@ -41,12 +41,9 @@ import re
 import time
 from typing import Any, ClassVar, Iterator, List, Optional, Type
 
-from chatbot_conversation.models.base import (
-    ChatbotBase,
-    ChatbotConfig,
-    ConversationMessage,
-)
+from chatbot_conversation.models.base import ChatbotBase, ChatbotConfig
 from chatbot_conversation.models.bot_registry import register_bot
+from chatbot_conversation.models.messages import ConversationMessage
 from chatbot_conversation.utils import APIException, ErrorSeverity
 
 # Model configuration constants
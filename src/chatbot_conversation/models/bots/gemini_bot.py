@@ -25,17 +25,15 @@ Classes:
 """
 
 import json
+import logging
 from typing import Any, Iterator, List, Optional, Type, TypedDict
 
 import google.api_core.exceptions
 import google.generativeai
 
-from chatbot_conversation.models.base import (
-    ChatbotBase,
-    ChatbotConfig,
-    ConversationMessage,
-)
+from chatbot_conversation.models.base import ChatbotBase, ChatbotConfig
 from chatbot_conversation.models.bot_registry import register_bot
+from chatbot_conversation.models.messages import ConversationMessage, FormattedHistory
 from chatbot_conversation.utils import APIException, ErrorSeverity
 
 # Gemini 1.5 models default temperature (others may vary)
@@ -179,6 +177,8 @@ class GeminiChatbot(ChatbotBase):
         """
         super().__init__(config)
 
+        self._gemini_history: FormattedHistory[_GeminiMessage] = FormattedHistory()
+
         google.generativeai.configure()
 
         # initialise api here
@@ -205,10 +205,18 @@ class GeminiChatbot(ChatbotBase):
         """
         formatted_messages = self._format_conv_for_gemini_api(conversation)
 
-        message = self._model_api.generate_content(formatted_messages)
+        message = self._model_api.generate_content(
+            formatted_messages,
+            request_options={"timeout": self.model_timeout.api_timeout},
+        )
         response: str = message.text
         return response
 
+    def clear_format_cache(self) -> None:
+        """Discard conversation messages already formatted for either API format."""
+        super().clear_format_cache()
+        self._gemini_history.clear()
+
     def _format_conv_for_gemini_api(
         self, conversation: List[ConversationMessage]
     ) -> List[_GeminiMessage]:
@@ -218,19 +226,25 @@ class GeminiChatbot(ChatbotBase):
         Converts internal message format to Gemini's expected structure with
         appropriate role assignments ('model' or 'user').
 
+        Messages formatted by an earlier call are reused, see FormattedHistory.
+
         Args:
             conversation: Complete conversation history to format
 
         Returns:
             List[_GeminiMessage]: Messages formatted for Gemini API submission
         """
-        messages: List[_GeminiMessage] = []
+        bot_index = self.bot_index
+
+        def to_gemini_message(contribution: ConversationMessage) -> _GeminiMessage:
+            role = "model" if contribution["bot_index"] == bot_index else "user"
+            return {"role": role, "parts": contribution["content"]}
 
-        for contribution in conversation:
-            role = "model" if contribution["bot_index"] == self.bot_index else "user"
-            messages.append({"role": role, "parts": contribution["content"]})
+        messages = list(self._gemini_history.update(conversation, to_gemini_message))
 
-        self._log_debug(json.dumps(messages, indent=2))
+        # Serialising the whole history is only worth doing if it will be logged
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._log_debug(json.dumps(messages, indent=2))
 
         return messages
 
@@ -292,4 +306,5 @@ class GeminiChatbot(ChatbotBase):
         return self._model_api.generate_content(  # type: ignore
             self._format_conv_for_gemini_api(conversation),
             stream=True,
+            request_options={"timeout": self.model_timeout.api_timeout},
         )
@@ -29,12 +29,9 @@ from typing import Any, Iterator, List, Optional, Type
 import openai
 from openai import OpenAI
 
-from chatbot_conversation.models.base import (
-    ChatbotBase,
-    ChatbotConfig,
-    ConversationMessage,
-)
+from chatbot_conversation.models.base import ChatbotBase, ChatbotConfig
 from chatbot_conversation.models.bot_registry import register_bot
+from chatbot_conversation.models.messages import ConversationMessage
 from chatbot_conversation.utils import APIException, ErrorSeverity
 
 # OpenAI default temperature for GPT models
@@ -70,12 +67,23 @@ class GPTChatbot(ChatbotBase):
 
     Attributes:
         Inherits all attributes from ChatbotBase plus:
-        _model_api (openai.OpenAI): Authenticated OpenAI API client
+        _model_api (openai.OpenAI): Authenticated OpenAI API client, shared by all
+            GPT bots
 
     Notes:
         Requires OpenAI API key to be set in environment variables
     """
 
+    @classmethod
+    def _create_model_api(cls) -> OpenAI:
+        """
+        Create the OpenAI API client used by every GPT bot.
+
+        Returns:
+            OpenAI: Authenticated OpenAI API client, SDK retries disabled
+        """
+        return OpenAI(max_retries=0)
+
     @classmethod
     def available_versions(cls) -> Optional[List[str]]:
         """
@@ -90,7 +98,11 @@ class GPTChatbot(ChatbotBase):
         """
         if cls._available_versions_cache is None:
             try:
-                api = OpenAI()
+                # The shared client only skips retries for responses, which
+                # ChatbotBase retries, model listing keeps the SDK's retries
+                api = cls._get_shared_model_api().with_options(
+                    max_retries=openai.DEFAULT_MAX_RETRIES
+                )
                 models = api.models.list()
                 cls._available_versions_cache = [model.id for model in models]
             except (
@@ -162,7 +174,7 @@ class GPTChatbot(ChatbotBase):
         """
         super().__init__(config)
 
-        self._model_api = OpenAI()
+        self._model_api = self._get_shared_model_api()
 
     def _generate_response(self, conversation: List[ConversationMessage]) -> str:
         """
@@ -23,8 +23,9 @@ import httpx
 import ollama
 from ollama import ChatResponse
 
-from chatbot_conversation.models.base import ChatbotBase, ConversationMessage
+from chatbot_conversation.models.base import ChatbotBase
 from chatbot_conversation.models.bot_registry import register_bot
+from chatbot_conversation.models.messages import ConversationMessage
 from chatbot_conversation.utils import APIException, ErrorSeverity
 
 # Model temperature range specifically for Ollama API
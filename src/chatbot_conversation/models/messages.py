@@ -0,0 +1,112 @@
+"""
+Message formats exchanged between the conversation and model APIs.
+
+Bots send the whole conversation on every turn, but between turns the
+conversation only grows. FormattedHistory keeps the messages already
+formatted for a model API so that each turn only formats the new tail.
+
+Classes:
+    ChatMessage: Message format for API communication
+    ConversationMessage: Internal message format for conversation tracking
+    FormattedHistory: Per-bot cache of conversation messages formatted for an API
+
+Functions:
+    to_chat_message: Format a conversation message as a ChatMessage
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Generic, List, Optional, TypedDict, TypeVar
+
+# Message type of a model API, e.g. ChatMessage
+FormattedT = TypeVar("FormattedT")
+
+
+class ChatMessage(TypedDict):
+    """
+    Message format for API communication.
+
+    Attributes:
+        role: Message source ('system', 'user', 'assistant')
+        content: Message text
+    """
+
+    role: str
+    content: str
+
+
+class ConversationMessage(TypedDict):
+    """
+    Internal message format for conversation tracking.
+
+    Attributes:
+        bot_index: Unique identifier of source bot
+        content: Message text
+    """
+
+    bot_index: int
+    content: str
+
+
+def to_chat_message(contribution: ConversationMessage, bot_index: int) -> ChatMessage:
+    """
+    Format a conversation message as a ChatMessage from a bot's point of view.
+
+    Args:
+        contribution (ConversationMessage): The conversation message to format
+        bot_index (int): Index of the bot the message is formatted for, its own
+            messages are given the 'assistant' role and all others 'user'
+
+    Returns:
+        ChatMessage: The formatted message
+    """
+    role = "assistant" if contribution["bot_index"] == bot_index else "user"
+    return {"role": role, "content": contribution["content"]}
+
+
+@dataclass(slots=True)
+class FormattedHistory(Generic[FormattedT]):
+    """
+    Cache of conversation messages already formatted for a model API.
+
+    The conversation is expected to be append-only between calls, so only the
+    message at the end of the cached prefix is compared with the last message
+    formatted. A shorter conversation, or one where that message differs, is
+    formatted again from the start. Edits to earlier messages are not detected.
+
+    Attributes:
+        messages: The formatted messages, one per conversation message
+        last_source: The last conversation message that was formatted
+    """
+
+    messages: List[FormattedT] = field(default_factory=list)
+    last_source: Optional[ConversationMessage] = None
+
+    def clear(self) -> None:
+        """Discard all formatted messages."""
+        self.messages.clear()
+        self.last_source = None
+
+    def update(
+        self,
+        conversation: List[ConversationMessage],
+        format_message: Callable[[ConversationMessage], FormattedT],
+    ) -> List[FormattedT]:
+        """
+        Format conversation history, reusing messages formatted by an earlier call.
+
+        Args:
+            conversation (List[ConversationMessage]): The conversation to format
+            format_message (Callable): Formats a single conversation message
+
+        Returns:
+            List: The cached formatted messages, callers must copy it before changing it
+        """
+        cached = len(self.messages)
+        if cached and (len(conversation) < cached or conversation[cached - 1] != self.last_source):
+            self.clear()
+            cached = 0
+
+        if len(conversation) > cached:
+            self.messages.extend(map(format_message, conversation[cached:]))
+            self.last_source = conversation[-1]
+        return self.messages
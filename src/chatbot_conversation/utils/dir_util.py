@@ -8,7 +8,10 @@ and current working directory.
 """
 
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
+from typing import List, Optional, Tuple
 
 from chatbot_conversation.utils.logging_util import LOGNAME_UTILS, get_logger
 
@@ -21,6 +24,10 @@ OUTPUT_DIR_ENV_VAR: str = "BOTCONV_OUTPUT_DIR"
 DEFAULT_OUTPUT_DIR: str = "output"
 FILE_IN_PROJECT_ROOT: str = "pyproject.toml"
 
+# Matches any path separator, a bare "." or "..", or a drive letter prefix
+# followed by a filename (so "C:file.txt" is rejected but "C:" is not)
+_NOT_SIMPLE_FILENAME_PATTERN = re.compile(r"[\\/]|\A\.\.?\Z|\A.:.", re.DOTALL)
+
 
 def get_config_dir() -> Path:
     """Determine and return the configuration directory path.
@@ -30,12 +37,31 @@ def get_config_dir() -> Path:
     2. Uses 'config' directory in the project root if found
     3. Falls back to current working directory if above options fail
 
+    The result is cached per environment variable value and working directory,
+    use clear_dir_caches() to force a fresh lookup.
+
     Returns:
         Path: Directory path for configuration files, created if necessary
     """
+    return _get_config_dir_cached(os.getenv(CONFIG_DIR_ENV_VAR), Path.cwd())
+
+
+@lru_cache(maxsize=1)
+def _get_config_dir_cached(env_dir: Optional[str], current: Path) -> Path:
+    """Cached worker for get_config_dir keyed on its environment inputs.
+
+    Args:
+        env_dir (Optional[str]): Value of the config directory environment variable
+        current (Path): Current working directory
+
+    Returns:
+        Path: Directory path for configuration files
+    """
     # creat_dir set to false since used to search for files that should already
     # exist in the config directory
-    return _get_dir(CONFIG_DIR_ENV_VAR, FILE_IN_PROJECT_ROOT, DEFAULT_CONFIG_DIR, False)
+    return _get_dir(
+        CONFIG_DIR_ENV_VAR, env_dir, current, FILE_IN_PROJECT_ROOT, DEFAULT_CONFIG_DIR, False
+    )
 
 
 def get_output_dir() -> Path:
@@ -49,14 +75,40 @@ def get_output_dir() -> Path:
     Returns:
         Path: Directory path for output files, created if necessary
     """
-    return _get_dir(OUTPUT_DIR_ENV_VAR, FILE_IN_PROJECT_ROOT, DEFAULT_OUTPUT_DIR)
+    return _get_dir(
+        OUTPUT_DIR_ENV_VAR,
+        os.getenv(OUTPUT_DIR_ENV_VAR),
+        Path.cwd(),
+        FILE_IN_PROJECT_ROOT,
+        DEFAULT_OUTPUT_DIR,
+    )
+
 
+def clear_dir_caches() -> None:
+    """Clear the cached config directory and project root lookups.
 
-def _get_dir(env_var: str, target_file: str, default_dir: str, create_dir: bool = True) -> Path:
+    Both lookups are cached for the life of the process. Call this after
+    creating or removing a project root marker file or config directory
+    that an earlier lookup may have seen.
+    """
+    _get_config_dir_cached.cache_clear()
+    _find_project_roots.cache_clear()
+
+
+def _get_dir(
+    env_var: str,
+    env_dir: Optional[str],
+    current: Path,
+    target_file: str,
+    default_dir: str,
+    create_dir: bool = True,
+) -> Path:
     """Locate or create a directory based on priority rules.
 
     Args:
         env_var (str): Environment variable name to check for directory path
+        env_dir (Optional[str]): Value of the environment variable, None if unset
+        current (Path): Current working directory
         target_file (str): Filename to look for when identifying project root
         default_dir (str): Default directory name to create under project root
         create_dir (bool): If True, creates directories if they don't exist.
@@ -72,18 +124,17 @@ def _get_dir(env_var: str, target_file: str, default_dir: str, create_dir: bool
         When create_dir is False, directories must exist to be used.
     """
     # First priority: Check environment variable
-    env_dir = os.getenv(env_var)
     if env_dir is not None:
         dir_path = Path(env_dir)
-        if dir_path.exists():
+        existed = _stat_or_create_dir(dir_path, create_dir)
+        if existed:
             logger.info(
                 "Using existing environment variable setting %s with directory value: %s",
                 env_var,
                 dir_path,
             )
             return dir_path
-        if create_dir:
-            dir_path.mkdir(parents=True, exist_ok=True)
+        if existed is not None:
             logger.info(
                 "Created directory from environment variable %s: %s",
                 env_var,
@@ -97,24 +148,71 @@ def _get_dir(env_var: str, target_file: str, default_dir: str, create_dir: bool
         )
 
     # Second priority: Try to find project root and use/create directory there
-    current = Path.cwd()
-    for parent in [current, *current.parents]:
-        if (parent / target_file).exists():
-            root_output = parent / default_dir
-            if root_output.exists():
-                logger.info("Using existing directory under project root: %s", root_output)
-                return root_output
-            if create_dir:
-                root_output.mkdir(parents=True, exist_ok=True)
-                logger.info("Created directory under project root: %s", root_output)
-                return root_output
-            logger.warning("Project root directory %s does not contain %s", parent, default_dir)
+    for parent in _find_project_roots(current, target_file):
+        root_output = parent / default_dir
+        existed = _stat_or_create_dir(root_output, create_dir)
+        if existed:
+            logger.info("Using existing directory under project root: %s", root_output)
+            return root_output
+        if existed is not None:
+            logger.info("Created directory under project root: %s", root_output)
+            return root_output
+        logger.warning("Project root directory %s does not contain %s", parent, default_dir)
 
     # Third priority: Use current directory
     logger.info("Using current directory: %s", current)
     return current
 
 
+def _stat_or_create_dir(dir_path: Path, create_dir: bool) -> Optional[bool]:
+    """Check a directory with a single stat, creating it only when missing.
+
+    Args:
+        dir_path (Path): Directory to check
+        create_dir (bool): If True, creates the directory when it doesn't exist
+
+    Returns:
+        Optional[bool]: True if it already existed, False if it was created,
+            None if it is missing and create_dir is False
+    """
+    try:
+        os.stat(dir_path)
+        return True
+    except FileNotFoundError:
+        if not create_dir:
+            return None
+    os.makedirs(dir_path, exist_ok=True)
+    return False
+
+
+@lru_cache(maxsize=8)
+def _find_project_roots(start: Path, target_file: str) -> Tuple[Path, ...]:
+    """Find all directories at or above start that contain target_file.
+
+    Cached so that repeated config and output directory lookups from the same
+    working directory share a single walk up the filesystem, use
+    clear_dir_caches() to force a fresh walk.
+
+    Args:
+        start (Path): Directory to start the search from
+        target_file (str): Filename identifying a project root
+
+    Returns:
+        Tuple[Path, ...]: Candidate project roots, closest first
+    """
+    roots: List[Path] = []
+    current = str(start)
+    while True:
+        # os.path.exists follows symlinks, so a dangling link is not a root
+        if os.path.exists(os.path.join(current, target_file)):
+            roots.append(Path(current))
+        parent = os.path.dirname(current)
+        if parent == current:  # reached the filesystem root
+            break
+        current = parent
+    return tuple(roots)
+
+
 def path_is_simple_filename(filename: str) -> bool:
     """
     Check if the given filename is a simple filename (not a directory) without any path components.
@@ -127,16 +225,6 @@ def path_is_simple_filename(filename: str) -> bool:
     Returns:
         bool: True if it is a simple filename, False otherwise.
     """
-    # Reject empty filenames or special directory references
-    if not filename or filename in {".", ".."}:
-        return False
-
-    # Reject filenames containing path separators
-    if "/" in filename or "\\" in filename:
-        return False
-
-    # Reject filenames with Windows-style drive letters (e.g., "C:file.txt")
-    if len(filename) > 2 and filename[1] == ":":
-        return False  # Ensures it only matches cases like "C:file.txt"
-
-    return True
+    # Single scan rejecting empty filenames, special directory references,
+    # path separators and Windows-style drive letters (e.g., "C:file.txt")
+    return bool(filename) and _NOT_SIMPLE_FILENAME_PATTERN.search(filename) is None
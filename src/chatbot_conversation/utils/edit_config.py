@@ -11,6 +11,7 @@ Example:
 """
 
 import json
+import os
 import sys
 
 
@@ -20,7 +21,8 @@ def update_bot_config(config_file: str, new_bot_type: str, new_bot_version: str)
 
     This function reads a JSON configuration file, updates the bot_type and
     bot_version for all bots defined in the configuration, and writes the
-    changes back to the file.
+    changes back to the file. The file is left untouched if no bot needs
+    changing.
 
     Args:
         config_file (str): Path to the config JSON file.
@@ -44,14 +46,28 @@ def update_bot_config(config_file: str, new_bot_type: str, new_bot_version: str)
         with open(config_file, "r", encoding="utf-8") as f:
             config = json.load(f)
 
+        # Skip rewriting the file if every bot already has the requested settings
+        if all(
+            isinstance(bot, dict)
+            and bot.get("bot_type") == new_bot_type
+            and bot.get("bot_version") == new_bot_version
+            for bot in config["bots"]
+        ):
+            print(f"No changes needed for {config_file}")
+            print(f"All bots already have type: {new_bot_type} and version: {new_bot_version}")
+            return
+
         # Update all bots
         for bot in config["bots"]:
             bot["bot_type"] = new_bot_type
             bot["bot_version"] = new_bot_version
 
-        # Write the updated config back to file
-        with open(config_file, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=4)
+        # Write the updated config to a temporary file in one call, then swap it in
+        # so an interrupted write cannot leave a truncated config behind
+        temp_file = f"{config_file}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as f:
+            f.write(json.dumps(config, indent=4))
+        os.replace(temp_file, config_file)
 
         print(f"Successfully updated {config_file}")
         print(f"All bots now have type: {new_bot_type} and version: {new_bot_version}")
@@ -9,15 +9,19 @@ The APIConfig class handles:
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict, List, Optional
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 
 from chatbot_conversation.utils.logging_util import LOGNAME_CONFIGURATION, get_logger
 
-FILE_IN_PROJECT_ROOT = "pyproject.toml"
-DEFAULT_CONFIG_DIR = "config"
-CONFIG_DIR_ENV_VAR = "BOTCONV_CONFIG_DIR"
+DOTENV_FILENAME = ".env"
+API_KEY_SUFFIX = "_API_KEY"
+
+# API keys read by the bundled bots, reported without scanning the whole environment
+KNOWN_API_KEYS = ("OPENAI_API_KEY", "ANTHROPIC_API_KEY", "GOOGLE_API_KEY")
 
 logger = get_logger(LOGNAME_CONFIGURATION)
 
@@ -39,15 +43,56 @@ class APIConfig:  # pylint: disable=too-few-public-methods
         """
 
         current = Path.cwd()
-        dotenv_path = current / ".env"
+        dotenv_path = current / DOTENV_FILENAME
+        api_keys: List[str] = list(KNOWN_API_KEYS)
 
-        if os.path.exists(dotenv_path):
-            load_dotenv(dotenv_path=dotenv_path)
-            logger.info("Loaded environment from: %s", dotenv_path)
-        else:  # Only log info not debug message - environment could be set already
+        # The stat both checks the file exists and keys the parse cache, so
+        # repeated setup_env calls only re-read the file if it has changed
+        try:
+            stat_result = dotenv_path.stat()
+            values = _read_dotenv(dotenv_path, stat_result.st_mtime_ns, stat_result.st_size)
+        except (FileNotFoundError, IsADirectoryError):
+            # Only log info not debug message - environment could be set already
             logger.info("No .env file found in current directory with path: %s", dotenv_path)
+        else:
+            # As with load_dotenv, variables already in the environment take precedence
+            for key, value in values.items():
+                if value is not None and key not in os.environ:
+                    os.environ[key] = value
+                if key.endswith(API_KEY_SUFFIX) and key not in KNOWN_API_KEYS:
+                    api_keys.append(key)
+            logger.info("Loaded environment from: %s", dotenv_path)
 
-        # Log available API-related environment variables without assuming which are required
-        for env_var in os.environ:
-            if env_var.endswith("_API_KEY"):
+        # Log which API keys are set without assuming which are required, other
+        # keys are only reported if they are defined in the .env file
+        for env_var in api_keys:
+            if env_var in os.environ:
                 logger.info("%s is set in environment", env_var)
+
+
+@lru_cache(maxsize=8)
+def _read_dotenv(dotenv_path: Path, mtime_ns: int, size: int) -> Dict[str, Optional[str]]:
+    """Parse a .env file, cached by path, mtime and size.
+
+    An edit that keeps the file the same size within the filesystem's
+    timestamp granularity leaves both keys unchanged, so it is not seen
+    until the file changes again or the cache is cleared.
+
+    Values are read without ${VAR} interpolation, as an expansion against the
+    environment at the time of the first read would be cached with them.
+
+    Args:
+        dotenv_path (Path): Path to the .env file
+        mtime_ns (int): File modification time in nanoseconds (cache key only)
+        size (int): File size in bytes (cache key only)
+
+    Returns:
+        Dict[str, Optional[str]]: Variables defined in the file
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        IsADirectoryError: If the path is a directory
+    """
+    del mtime_ns, size  # only used as cache key
+    with open(dotenv_path, "r", encoding="utf-8") as stream:
+        return dict(dotenv_values(stream=stream, interpolate=False))
@@ -22,17 +22,46 @@ Example:
         print(f"User message: {e.user_message}")
 """
 
-from dataclasses import dataclass
 from enum import Enum, auto
 
 # Add after existing imports
 from functools import wraps
-from typing import Any, Callable, Optional, TypeVar
+from typing import Any, Callable, Final, Optional, Tuple, Type, TypeVar
 
 from pydantic import ValidationError
 
 T = TypeVar("T")
 
+# Default user-friendly messages, created once at import
+_API_USER_MESSAGE: Final[str] = (
+    "There was a problem communicating with the AI service. Please try again in a few moments."
+)
+_CONFIGURATION_USER_MESSAGE: Final[str] = "There is a problem with the system configuration."
+_MODEL_USER_MESSAGE: Final[str] = (
+    "The AI model encountered a limitation. Try simplifying your request."
+)
+_SYSTEM_USER_MESSAGE: Final[str] = "A critical system error has occurred."
+_VALIDATION_USER_MESSAGE: Final[str] = (
+    "The provided data does not meet the required format or constraints."
+)
+
+
+def _format_validation_error_details(error: ValidationError) -> str:
+    """Format each Pydantic error as "loc -> path: msg", one per line.
+
+    Only called on the failure path so successful validation pays nothing for it.
+
+    Args:
+        error: The Pydantic ValidationError to format
+
+    Returns:
+        str: Newline separated error details
+    """
+    return "\n".join(
+        f"{' -> '.join(str(item) for item in detail['loc'])}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
 
 # Add after ErrorSeverity class but before exception classes
 def handle_pydantic_validation_errors(f: Callable[..., T]) -> Callable[..., T]:
@@ -50,13 +79,7 @@ def handle_pydantic_validation_errors(f: Callable[..., T]) -> Callable[..., T]:
         try:
             return f(*args, **kwargs)
         except ValidationError as e:
-            error_details: list[str] = []
-            for error in e.errors():
-                loc = " -> ".join(str(item) for item in error["loc"])
-                msg = error["msg"]
-                error_details.append(f"{loc}: {msg}")
-
-            error_msg = "\n".join(error_details)
+            error_msg = _format_validation_error_details(e)
 
             raise ValidationException(
                 message=f"Validation failed: {error_msg}",
@@ -79,7 +102,6 @@ class ErrorSeverity(Enum):
     FATAL = auto()  # Critical issue preventing operation
 
 
-@dataclass
 class ChatbotException(Exception):
     """Base class for all chatbot-related exceptions.
 
@@ -90,10 +112,25 @@ class ChatbotException(Exception):
         original_error: Original exception that caused this error
     """
 
-    message: str
-    user_message: str
-    severity: ErrorSeverity
-    original_error: Optional[Exception] = None
+    def __init__(
+        self,
+        message: str,
+        user_message: str,
+        severity: ErrorSeverity,
+        original_error: Optional[Exception] = None,
+    ):
+        Exception.__init__(self, message)
+        self.message = message
+        self.user_message = user_message
+        self.severity = severity
+        self.original_error = original_error
+
+    def __reduce__(self) -> Tuple[Type["ChatbotException"], Tuple[Any, ...]]:
+        """Pickle with every constructor argument, as args only holds the message."""
+        return (
+            self.__class__,
+            (self.message, self.user_message, self.severity, self.original_error),
+        )
 
     def __str__(self) -> str:
         """Return the technical error message with traceback info if available."""
@@ -101,8 +138,15 @@ class ChatbotException(Exception):
             return f"{self.message} (caused by: {self.original_error})"
         return self.message
 
+    def __repr__(self) -> str:
+        """Return a representation listing all exception attributes."""
+        return (
+            f"{self.__class__.__name__}(message={self.message!r}, "
+            f"user_message={self.user_message!r}, severity={self.severity!r}, "
+            f"original_error={self.original_error!r})"
+        )
+
 
-@dataclass
 class APIException(ChatbotException):
     """Errors related to external API communication.
 
@@ -116,17 +160,13 @@ class APIException(ChatbotException):
     def __init__(
         self,
         message: str,
-        user_message: str = (
-            "There was a problem communicating with the AI service. "
-            "Please try again in a few moments."
-        ),
+        user_message: str = _API_USER_MESSAGE,
         severity: ErrorSeverity = ErrorSeverity.ERROR,
         original_error: Optional[Exception] = None,
     ):
-        super().__init__(message, user_message, severity, original_error)
+        ChatbotException.__init__(self, message, user_message, severity, original_error)
 
 
-@dataclass
 class ConfigurationException(ChatbotException):
     """Errors related to system configuration.
 
@@ -139,14 +179,13 @@ class ConfigurationException(ChatbotException):
     def __init__(
         self,
         message: str,
-        user_message: str = "There is a problem with the system configuration.",
+        user_message: str = _CONFIGURATION_USER_MESSAGE,
         severity: ErrorSeverity = ErrorSeverity.FATAL,
         original_error: Optional[Exception] = None,
     ):
-        super().__init__(message, user_message, severity, original_error)
+        ChatbotException.__init__(self, message, user_message, severity, original_error)
 
 
-@dataclass
 class ModelException(ChatbotException):
     """Errors specific to AI model operation.
 
@@ -159,14 +198,13 @@ class ModelException(ChatbotException):
     def __init__(
         self,
         message: str,
-        user_message: str = "The AI model encountered a limitation. Try simplifying your request.",
+        user_message: str = _MODEL_USER_MESSAGE,
         severity: ErrorSeverity = ErrorSeverity.ERROR,
         original_error: Optional[Exception] = None,
     ):
-        super().__init__(message, user_message, severity, original_error)
+        ChatbotException.__init__(self, message, user_message, severity, original_error)
 
 
-@dataclass
 class SystemException(ChatbotException):
     """Critical system-level errors.
 
@@ -179,14 +217,13 @@ class SystemException(ChatbotException):
     def __init__(
         self,
         message: str,
-        user_message: str = "A critical system error has occurred.",
+        user_message: str = _SYSTEM_USER_MESSAGE,
         severity: ErrorSeverity = ErrorSeverity.FATAL,
         original_error: Optional[Exception] = None,
     ):
-        super().__init__(message, user_message, severity, original_error)
+        ChatbotException.__init__(self, message, user_message, severity, original_error)
 
 
-@dataclass
 class ValidationException(ChatbotException):
     """Errors related to data validation.
 
@@ -199,8 +236,8 @@ class ValidationException(ChatbotException):
     def __init__(
         self,
         message: str,
-        user_message: str = "The provided data does not meet the required format or constraints.",
+        user_message: str = _VALIDATION_USER_MESSAGE,
         severity: ErrorSeverity = ErrorSeverity.ERROR,
         original_error: Optional[Exception] = None,
     ):
-        super().__init__(message, user_message, severity, original_error)
+        ChatbotException.__init__(self, message, user_message, severity, original_error)
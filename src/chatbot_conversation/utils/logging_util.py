@@ -7,7 +7,8 @@ and retrieve named logger instances. It uses Python's built-in logging module.
 
 import logging
 import logging.config
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet
 
 LOGNAME_API = "api"
 LOGNAME_CONFIGURATION = "configuration"
@@ -36,6 +37,7 @@ LOGGING_CONFIG: Dict[str, Any] = {
             "formatter": "defaultFormatter",
             "filename": "chatbot_conversation.log",
             "mode": "a",
+            "delay": True,  # open the log file on first write, not at import
         },
     },
     "loggers": {
@@ -81,11 +83,19 @@ LOGGING_CONFIG: Dict[str, Any] = {
 # Configure logging using dictionary config
 logging.config.dictConfig(LOGGING_CONFIG)
 
+# Logger names accepted by get_logger, precomputed for the membership test and error message
+_VALID_LOGGERS: FrozenSet[str] = frozenset(LOGGING_CONFIG["loggers"])
+_VALID_LOGGERS_STR: str = ", ".join(LOGGING_CONFIG["loggers"].keys())
 
+
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """
     Get a configured logger instance with the specified name.
 
+    Results are cached, logging.getLogger always returns the same instance
+    for a name so repeat calls can skip validation and the logging lock.
+
     Args:
         name (str): The name of the logger to retrieve. Usually __name__ of the module.
 
@@ -100,10 +110,9 @@ def get_logger(name: str) -> logging.Logger:
         >>> logger.info("This is a log message")
     """
     # Check if this is a explicitly configured logger name
-    if name not in LOGGING_CONFIG["loggers"]:
+    if name not in _VALID_LOGGERS:
         raise ValueError(
-            f"Logger '{name}' is not currently supported. "
-            f"Must be one of: {', '.join(LOGGING_CONFIG['loggers'].keys())}"
+            f"Logger '{name}' is not currently supported. Must be one of: {_VALID_LOGGERS_STR}"
         )
 
     return logging.getLogger(name)
@@ -29,10 +29,12 @@ def reset_chatbot_base() -> None:
     This ensures each test starts with a clean state for:
     - _total_count: Number of bot instances
     - _used_names: Set of used bot names
+    - _shared_model_apis: API clients shared by bots of the same type
     """
     # Intentionally accessing protected members for testing purposes
     ChatbotBase._total_count = 0
     ChatbotBase._used_names.clear()
+    ChatbotBase._shared_model_apis.clear()
 
 
 @pytest.fixture(autouse=True)
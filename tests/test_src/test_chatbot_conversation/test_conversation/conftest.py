@@ -4,6 +4,7 @@ This module provides pytest fixtures used across multiple test modules,
 including configuration data, mock objects, and manager instances.
 """
 
+import json
 import os
 from pathlib import Path
 from typing import List
@@ -142,6 +143,49 @@ def manager(test_config_path: str) -> ConversationManager:
     return ConversationManager(test_config_path)
 
 
+@pytest.fixture
+def dummy_manager(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> ConversationManager:
+    """Provide a ConversationManager with two dummy bots that needs no network access.
+
+    Simulated dummy API failures are disabled so tests are deterministic.
+
+    Args:
+        monkeypatch: Fixture for patching the dummy bot random source
+        tmp_path: Temporary directory for the configuration file
+
+    Returns:
+        ConversationManager: Instance of ConversationManager using DUMMY bots
+    """
+    monkeypatch.setattr("chatbot_conversation.models.bots.dummy_bot.random.random", lambda: 0.5)
+    monkeypatch.setattr("chatbot_conversation.models.bots.dummy_bot.time.sleep", lambda _: None)
+    config = {
+        "author": "Test Author",
+        "conversation_seed": "Dummy seed",
+        "rounds": 2,
+        "core_prompt": "You are {bot_name}. ",
+        "moderator_messages_opt": [
+            {"round_number": 2, "content": "Second round moderator", "display_opt": True}
+        ],
+        "bots": [
+            {
+                "bot_name": "Dummy1",
+                "bot_type": "DUMMY",
+                "bot_version": "tpg-o1",
+                "bot_prompt": "Dummy bot.",
+            },
+            {
+                "bot_name": "Dummy2",
+                "bot_type": "DUMMY",
+                "bot_version": "tpg-o1",
+                "bot_prompt": "Dummy bot.",
+            },
+        ],
+    }
+    config_path = tmp_path / "dummy_test.config.json"
+    config_path.write_text(json.dumps(config), encoding="utf-8")
+    return ConversationManager(str(config_path))
+
+
 @pytest.fixture
 def sample_private_messages() -> List[ConversationMessage]:
     """Return sample messages with private content for testing.
@@ -2,9 +2,18 @@
 This module contains tests for the BotsInitializer class.
 """
 
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Set
+
+import pytest
+
 from chatbot_conversation.conversation import ConversationConfig
 from chatbot_conversation.conversation.bots_initializer import BotsInitializer
 from chatbot_conversation.models import ChatbotBase
+from chatbot_conversation.models.bots.claude_bot import ClaudeChatbot
+from chatbot_conversation.models.bots.gpt_bot import GPTChatbot
+from chatbot_conversation.utils import APIException, ValidationException
 
 
 class TestBotsInitializer:
@@ -21,3 +30,131 @@ class TestBotsInitializer:
         assert len(result) == 2
         for bot in result:
             assert isinstance(bot, ChatbotBase)
+
+    def test_prefetch_available_versions(
+        self, monkeypatch: pytest.MonkeyPatch, sample_conversation_config: ConversationConfig
+    ) -> None:
+        """
+        Test that available versions are fetched once per distinct bot class on worker threads.
+        """
+        calls: List[str] = []
+        threads: Set[int] = set()
+
+        def fake_versions(name: str) -> classmethod:  # type: ignore[type-arg]
+            def available_versions(cls: type) -> Optional[List[str]]:
+                calls.append(name)
+                threads.add(threading.get_ident())
+                return None
+
+            return classmethod(available_versions)
+
+        monkeypatch.setattr(GPTChatbot, "available_versions", fake_versions("GPT"))
+        monkeypatch.setattr(ClaudeChatbot, "available_versions", fake_versions("CLAUDE"))
+        bots = [
+            sample_conversation_config.bots[0].model_copy(update={"bot_type": bot_type})
+            for bot_type in ("GPT", "GPT", "CLAUDE")
+        ]
+        config = sample_conversation_config.model_copy(update={"bots": bots})
+
+        BotsInitializer()._prefetch_available_versions(config)
+
+        assert sorted(calls) == ["CLAUDE", "GPT"]
+        assert threading.get_ident() not in threads
+
+    def test_prefetch_available_versions_error_raised_at_bot_creation(
+        self, monkeypatch: pytest.MonkeyPatch, sample_conversation_config: ConversationConfig
+    ) -> None:
+        """
+        Test that a failed version lookup is raised in place of creating the bot, without
+        being repeated.
+        """
+        calls: List[str] = []
+        error = APIException(message="network down")
+
+        def failing_versions(cls: type) -> Optional[List[str]]:
+            calls.append("GPT")
+            raise error
+
+        monkeypatch.setattr(GPTChatbot, "available_versions", classmethod(failing_versions))
+        monkeypatch.setattr(ClaudeChatbot, "available_versions", classmethod(lambda cls: None))
+        bots = [
+            sample_conversation_config.bots[0].model_copy(update={"bot_type": "CLAUDE"}),
+            sample_conversation_config.bots[1].model_copy(update={"bot_type": "gpt"}),
+        ]
+        config = sample_conversation_config.model_copy(update={"bots": bots})
+
+        with pytest.raises(APIException) as exc_info:
+            BotsInitializer().initialize_bots(config)
+
+        assert exc_info.value is error
+        assert calls == ["GPT"]
+
+    def test_initialize_bots_reuses_bots(
+        self, sample_conversation_config: ConversationConfig
+    ) -> None:
+        """
+        Test that initialising the same config again with reuse_bots reuses the bots
+        already built, while by default the duplicate bot names are rejected.
+        """
+        first = BotsInitializer().initialize_bots(sample_conversation_config, reuse_bots=True)
+        second = BotsInitializer().initialize_bots(sample_conversation_config, reuse_bots=True)
+
+        assert all(a is b for a, b in zip(first, second, strict=True))
+        assert ChatbotBase.get_total_bots() == len(first)
+
+        with pytest.raises(ValidationException, match="already in use"):
+            BotsInitializer().initialize_bots(sample_conversation_config)
+
+    def test_initialize_bots_clears_reused_bot_format_cache(
+        self, sample_conversation_config: ConversationConfig
+    ) -> None:
+        """
+        Test that a reused bot does not carry formatted messages from its last conversation.
+        """
+        bot = BotsInitializer().initialize_bots(sample_conversation_config, reuse_bots=True)[0]
+        bot._format_conv_for_api_util([{"bot_index": 0, "content": "Earlier conversation"}])
+        assert bot._formatted_history.messages
+
+        reused = BotsInitializer().initialize_bots(sample_conversation_config, reuse_bots=True)[0]
+
+        assert reused is bot
+        assert not reused._formatted_history.messages
+
+    def test_bot_cache_evicts_least_recently_used(
+        self, monkeypatch: pytest.MonkeyPatch, sample_conversation_config: ConversationConfig
+    ) -> None:
+        """
+        Test that the bot cache is bounded and evicts the least recently used bot.
+        """
+        monkeypatch.setattr("chatbot_conversation.conversation.bots_initializer.BOT_CACHE_SIZE", 2)
+        monkeypatch.setattr(BotsInitializer, "_bot_cache", OrderedDict())
+        first, second = BotsInitializer().initialize_bots(
+            sample_conversation_config, reuse_bots=True
+        )
+
+        # Reusing the first bot makes the second the least recently used
+        bots = [sample_conversation_config.bots[0]]
+        BotsInitializer().initialize_bots(
+            sample_conversation_config.model_copy(update={"bots": bots}), reuse_bots=True
+        )
+        other = sample_conversation_config.bots[0].model_copy(update={"bot_name": "OtherBot"})
+        BotsInitializer().initialize_bots(
+            sample_conversation_config.model_copy(update={"bots": [other]}), reuse_bots=True
+        )
+
+        cached = list(BotsInitializer._bot_cache.values())
+        assert len(cached) == 2
+        assert first in cached
+        assert second not in cached
+
+    def test_initialize_bots_does_not_cache_by_default(
+        self, monkeypatch: pytest.MonkeyPatch, sample_conversation_config: ConversationConfig
+    ) -> None:
+        """
+        Test that bots are only kept for reuse when reuse_bots is set.
+        """
+        monkeypatch.setattr(BotsInitializer, "_bot_cache", OrderedDict())
+
+        BotsInitializer().initialize_bots(sample_conversation_config)
+
+        assert not BotsInitializer._bot_cache
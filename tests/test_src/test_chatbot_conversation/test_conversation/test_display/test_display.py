@@ -2,9 +2,11 @@
 Unit tests for the RichDisplayManager class in display.py.
 """
 
+from io import StringIO
 from typing import Generator
 
 from _pytest.capture import CaptureFixture
+from rich.console import Console
 
 from chatbot_conversation.conversation.display import RichDisplay
 
@@ -34,3 +36,25 @@ def test_show_streaming_text(display: RichDisplay, capsys: CaptureFixture[str])
     captured = capsys.readouterr()
     # Optionally check partial output, but here we ensure the first chunk is seen
     assert "Chunk1" in captured.out
+
+
+def test_clear(display: RichDisplay) -> None:
+    """
+    Test that clear writes the ANSI clear screen and cursor home codes to a terminal.
+    """
+    output = StringIO()
+    display.console = Console(file=output, force_terminal=True)
+
+    display.clear()
+
+    assert output.getvalue() == "\x1b[2J\x1b[H"
+
+
+def test_show_text_repeated(display: RichDisplay, capsys: CaptureFixture[str]) -> None:
+    """
+    Test that repeated text is printed each time it is shown.
+    """
+    display.show_text("Repeated text")
+    display.show_text("Repeated text")
+    captured = capsys.readouterr()
+    assert captured.out.count("Repeated text") == 2
@@ -6,6 +6,7 @@ parameter validation. It covers template variable validation, moderator message
 validation, and bot configuration validation.
 """
 
+import os
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -41,6 +42,51 @@ def test_load_valid_config(test_config_path: str) -> None:
     assert len(config.moderator_messages_opt) > 0
 
 
+def test_load_config_cached_until_file_changes(test_config_path: str, tmp_path: Path) -> None:
+    """Test repeat loads reuse the validated config until the file changes.
+
+    Args:
+        test_config_path: Path to a valid test configuration file
+        tmp_path: Temporary directory path for creating test files
+    """
+    config_path: Path = tmp_path / "cached.json"
+    config_path.write_text(Path(test_config_path).read_text(encoding="utf-8"), encoding="utf-8")
+
+    first: ConversationConfig = load_conversation_config(config_path)
+    assert load_conversation_config(config_path) is first
+
+    config_path.write_text(
+        config_path.read_text(encoding="utf-8").replace("Brian Sentance", "Someone Else"),
+        encoding="utf-8",
+    )
+    reloaded: ConversationConfig = load_conversation_config(config_path)
+    assert reloaded is not first
+    assert reloaded.author == "Someone Else"
+
+
+def test_load_config_cache_relative_path(
+    test_config_path: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the same relative path in different directories loads each directory's file.
+
+    Args:
+        test_config_path: Path to a valid test configuration file
+        tmp_path: Temporary directory path for creating test files
+        monkeypatch: Pytest fixture for changing the working directory
+    """
+    content = Path(test_config_path).read_text(encoding="utf-8")
+    for author in ("Author One", "Author Two"):
+        # Same length and mtime so only the directory distinguishes the files
+        (tmp_path / author).mkdir()
+        config_path = tmp_path / author / "config.json"
+        config_path.write_text(content.replace("Brian Sentance", author), encoding="utf-8")
+        os.utime(config_path, ns=(0, 0))
+
+    for author in ("Author One", "Author Two"):
+        monkeypatch.chdir(tmp_path / author)
+        assert load_conversation_config(Path("config.json")).author == author
+
+
 def test_load_nonexistent_config(invalid_config_path: str) -> None:
     """Test loading a nonexistent configuration file raises FileNotFoundError.
 
@@ -189,3 +189,29 @@ def test_get_filtered_conversation(
     # Check fourth message (public only)
     assert filtered_conv[3]["content"] == "Just public content"
     assert filtered_conv[3]["bot_index"] == 3
+
+
+def test_run_round_with_moderator(dummy_manager: ConversationManager) -> None:
+    """
+    Test a round adds the moderator message for that round before bot responses.
+
+    Args:
+        dummy_manager (ConversationManager): Manager using DUMMY bots.
+
+    Verifies:
+        - Rounds without a moderator message only add bot responses
+        - The moderator message is added once, ahead of the bot responses
+        - Bot responses are appended in bot order
+    """
+    dummy_manager.run_round(1)
+    assert len(dummy_manager.conversation) == 3
+
+    dummy_manager.run_round(2)
+    assert len(dummy_manager.conversation) == 6
+    assert dummy_manager.conversation[3] == {
+        "bot_index": 0,
+        "content": "**Moderator**: Second round moderator",
+    }
+    assert [msg["bot_index"] for msg in dummy_manager.conversation[4:]] == [
+        bot.bot_index for bot in dummy_manager.bots
+    ]
@@ -1,6 +1,7 @@
 """Tests for ChatbotBase class"""
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, cast
 from unittest.mock import MagicMock
 
@@ -189,6 +190,67 @@ class TestChatbotBaseMessageFormatting:
         formatted = json.dumps(messages, indent=2)
         bot._log_debug(f"Formatted messages:\n{formatted}")
 
+    def test_api_message_formatting_reuses_history(
+        self,
+        bot_class: type[ChatbotBase],
+        basic_conversation: List[ConversationMessage],
+    ) -> None:
+        """Test that formatting a grown or changed conversation matches a fresh format"""
+        config = ChatbotConfig(
+            name="TestBot",
+            system_prompt="You are a helpful assistant.",
+            model=ChatbotModel(
+                type=bot_class.__name__.replace("Chatbot", "").upper(),
+                version="tpg-o4-mini",
+            ),
+        )
+        bot: ChatbotBase = bot_class(config)
+
+        def expected(conversation: List[ConversationMessage]) -> list[ChatMessage]:
+            return [{"role": "system", "content": bot.system_prompt}] + [
+                {
+                    "role": "assistant" if msg["bot_index"] == bot.bot_index else "user",
+                    "content": msg["content"],
+                }
+                for msg in conversation
+            ]
+
+        grown = basic_conversation + [{"bot_index": bot.bot_index, "content": "New reply"}]
+        changed: List[ConversationMessage] = [{"bot_index": 0, "content": "Different seed"}]
+
+        for conversation in (basic_conversation, grown, basic_conversation, changed):
+            assert bot._format_conv_for_api_util(conversation) == expected(conversation)
+
+    def test_api_message_formatting_new_conversation(self, bot_class: type[ChatbotBase]) -> None:
+        """Test that clearing the format cache reformats a conversation with the same tail"""
+        config = ChatbotConfig(
+            name="TestBot",
+            system_prompt="You are a helpful assistant.",
+            model=ChatbotModel(
+                type=bot_class.__name__.replace("Chatbot", "").upper(),
+                version="tpg-o4-mini",
+            ),
+        )
+        bot: ChatbotBase = bot_class(config)
+
+        first: List[ConversationMessage] = [
+            {"bot_index": 0, "content": "Seed A"},
+            {"bot_index": bot.bot_index, "content": "ok"},
+        ]
+        second: List[ConversationMessage] = [
+            {"bot_index": 0, "content": "Seed B"},
+            {"bot_index": bot.bot_index, "content": "ok"},
+        ]
+
+        bot._format_conv_for_api_util(first)
+        bot.clear_format_cache()
+        messages = bot._format_conv_for_api_util(second, add_system_prompt=False)
+
+        assert messages == [
+            {"role": "user", "content": "Seed B"},
+            {"role": "assistant", "content": "ok"},
+        ]
+
 
 @pytest.mark.parametrize("bot_class", bot_classes)
 class TestChatbotBaseTemperature:
@@ -305,6 +367,31 @@ class TestChatbotBaseCounter:
             assert bot.bot_index == initial_count
             assert bot_class.get_total_bots() == initial_count
 
+    def test_bot_counter_threads(
+        self, bot_class: type[ChatbotBase], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that bots constructed from several threads get distinct indices"""
+        # Avoid the dummy bot's simulated connection failures
+        monkeypatch.setattr("chatbot_conversation.models.bots.dummy_bot.random.random", lambda: 0.5)
+
+        def create_bot(i: int) -> ChatbotBase:
+            return bot_class(
+                ChatbotConfig(
+                    name=f"ThreadBot{i}",
+                    system_prompt="test",
+                    model=ChatbotModel(
+                        type=bot_class.__name__.replace("Chatbot", "").upper(),
+                        version="tpg-o4-mini",
+                    ),
+                )
+            )
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            bots = list(executor.map(create_bot, range(32)))
+
+        assert sorted(bot.bot_index for bot in bots) == list(range(1, 33))
+        assert bot_class.get_total_bots() == 32
+
 
 @pytest.mark.parametrize("bot_class", bot_classes)
 class TestChatbotBaseModelType:
@@ -488,6 +575,9 @@ class TestRetryBehavior:
         # Verify retry count matches max_retries
         assert mock_generate.call_count == bot.model_timeout.max_retries
         assert isinstance(exc_info.value.original_error, tenacity.RetryError)
+        assert exc_info.value.message == (
+            f"Max retries ({bot.model_timeout.max_retries}) exceeded during response generation"
+        )
 
 
 @pytest.mark.parametrize("bot_class", bot_classes)
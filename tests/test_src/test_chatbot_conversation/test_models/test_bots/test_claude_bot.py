@@ -1,7 +1,9 @@
 """Tests specific to ClaudeChatbot implementation"""
 
+from dataclasses import replace
 from unittest.mock import MagicMock, patch
 
+import anthropic
 import pytest
 from anthropic import APIConnectionError, APIError, RateLimitError
 
@@ -51,7 +53,9 @@ class TestClaudeChatbot:
         # Mock models list
         mock_model = MagicMock()
         mock_model.id = "claude-3-haiku-20240307"
-        mock_anthropic.return_value.models.list.return_value = [mock_model]
+        mock_anthropic.return_value.with_options.return_value.models.list.return_value = [
+            mock_model
+        ]
 
         # Create a mock response
         mock_message = MagicMock()
@@ -80,7 +84,84 @@ class TestClaudeChatbot:
         assert call_kwargs["timeout"] == bot.model_timeout.api_timeout
         assert isinstance(call_kwargs["messages"], list)
         assert "system" in call_kwargs
-        assert call_kwargs["system"] == bot.system_prompt
+        assert call_kwargs["system"] == [
+            {"type": "text", "text": bot.system_prompt, "cache_control": {"type": "ephemeral"}}
+        ]
+        assert call_kwargs["messages"] == [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": "Explain quantum computing",
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ],
+            }
+        ]
+
+    @patch("chatbot_conversation.models.bots.claude_bot.anthropic.Anthropic")
+    def test_format_conv_cache_breakpoint(
+        self, mock_anthropic: MagicMock, claude_config_for_tests: ChatbotConfig
+    ) -> None:
+        """Test only the last message is marked as a prompt cache breakpoint"""
+        mock_model = MagicMock()
+        mock_model.id = "claude-3-haiku-20240307"
+        mock_anthropic.return_value.with_options.return_value.models.list.return_value = [
+            mock_model
+        ]
+
+        bot = ClaudeChatbot(claude_config_for_tests)
+        conversation: list[ConversationMessage] = [
+            {"bot_index": 0, "content": "Seed"},
+            {"bot_index": bot.bot_index, "content": "Reply"},
+        ]
+
+        messages = bot._format_conv_for_claude_api(conversation)
+        assert messages[0] == {"role": "user", "content": "Seed"}
+        assert messages[1]["role"] == "assistant"
+        assert messages[1]["content"] == [
+            {"type": "text", "text": "Reply", "cache_control": {"type": "ephemeral"}}
+        ]
+
+        # The breakpoint moves to the new last message as the conversation grows
+        conversation.append({"bot_index": 0, "content": "Next"})
+        messages = bot._format_conv_for_claude_api(conversation)
+        assert messages[1] == {"role": "assistant", "content": "Reply"}
+        assert messages[2]["content"] == [
+            {"type": "text", "text": "Next", "cache_control": {"type": "ephemeral"}}
+        ]
+
+    @patch("chatbot_conversation.models.bots.claude_bot.anthropic.Anthropic")
+    def test_model_api_shared(
+        self, mock_anthropic: MagicMock, claude_config_for_tests: ChatbotConfig
+    ) -> None:
+        """Test all Claude bots share a single API client"""
+        mock_model = MagicMock()
+        mock_model.id = "claude-3-haiku-20240307"
+        mock_anthropic.return_value.with_options.return_value.models.list.return_value = [
+            mock_model
+        ]
+
+        bot1 = ClaudeChatbot(claude_config_for_tests)
+        bot2 = ClaudeChatbot(replace(claude_config_for_tests, name="OtherBot"))
+
+        assert bot1._model_api is bot2._model_api
+        mock_anthropic.assert_called_once_with(max_retries=0)
+
+    @patch("chatbot_conversation.models.bots.claude_bot.anthropic.Anthropic")
+    def test_available_versions_keeps_sdk_retries(self, mock_anthropic: MagicMock) -> None:
+        """Test model listing retries in the SDK as it runs outside the ChatbotBase retries"""
+        mock_model = MagicMock()
+        mock_model.id = "claude-3-haiku-20240307"
+        mock_anthropic.return_value.with_options.return_value.models.list.return_value = [
+            mock_model
+        ]
+
+        assert ClaudeChatbot.available_versions() == ["claude-3-haiku-20240307"]
+        mock_anthropic.return_value.with_options.assert_called_once_with(
+            max_retries=anthropic.DEFAULT_MAX_RETRIES
+        )
 
     @patch("chatbot_conversation.models.bots.claude_bot.anthropic.Anthropic")
     def test_empty_response_handling(
@@ -90,7 +171,9 @@ class TestClaudeChatbot:
         # Mock models list
         mock_model = MagicMock()
         mock_model.id = "claude-3-haiku-20240307"
-        mock_anthropic.return_value.models.list.return_value = [mock_model]
+        mock_anthropic.return_value.with_options.return_value.models.list.return_value = [
+            mock_model
+        ]
 
         # Mock empty response
         mock_message = MagicMock()
@@ -78,6 +78,10 @@ class TestGeminiChatbot:
         assert kwargs["model_name"] == gemini_config_for_tests.model.version
         assert kwargs["system_instruction"] == bot.system_prompt
 
+        # Verify the configured API timeout is applied to the request
+        generate_kwargs = mock_gemini_model.return_value.generate_content.call_args[1]
+        assert generate_kwargs["request_options"] == {"timeout": bot.model_timeout.api_timeout}
+
         # Verify generation config
         gen_config = kwargs["generation_config"]
         assert gen_config.temperature == bot.model_temperature
@@ -109,6 +113,39 @@ class TestGeminiChatbot:
         assert formatted[1] == {"role": "model", "parts": conversation[1]["content"]}
         assert formatted[2] == {"role": "user", "parts": conversation[2]["content"]}
 
+    def test_format_conv_for_gemini_api_reuses_history(self, gemini_chatbot: GeminiChatbot) -> None:
+        """Test formatting a grown or changed conversation matches a fresh format"""
+        bot_index = gemini_chatbot.bot_index
+
+        def expected(conversation: List[ConversationMessage]) -> List[_GeminiMessage]:
+            return [
+                {
+                    "role": "model" if msg["bot_index"] == bot_index else "user",
+                    "parts": msg["content"],
+                }
+                for msg in conversation
+            ]
+
+        seed: List[ConversationMessage] = [{"bot_index": 0, "content": "Hello"}]
+        grown = seed + [{"bot_index": bot_index, "content": "Hi there"}]
+        changed: List[ConversationMessage] = [{"bot_index": 0, "content": "Different seed"}]
+
+        for conversation in (seed, grown, seed, changed, grown):
+            assert gemini_chatbot._format_conv_for_gemini_api(conversation) == expected(
+                conversation
+            )
+
+    def test_clear_format_cache(self, gemini_chatbot: GeminiChatbot) -> None:
+        """Test clearing the format cache discards Gemini formatted messages"""
+        conversation: List[ConversationMessage] = [{"bot_index": 0, "content": "Hello"}]
+        gemini_chatbot._format_conv_for_gemini_api(conversation)
+        assert gemini_chatbot._gemini_history.messages
+
+        gemini_chatbot.clear_format_cache()
+
+        assert not gemini_chatbot._gemini_history.messages
+        assert not gemini_chatbot._formatted_history.messages
+
     def test_available_versions_returns_valid_list(self) -> None:
         """Test that available_versions returns non-empty list of model versions"""
         versions = GeminiChatbot.available_versions()
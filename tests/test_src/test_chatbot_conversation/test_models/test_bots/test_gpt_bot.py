@@ -47,7 +47,7 @@ class TestGPTChatbot:
         # Mock models list
         mock_model = MagicMock()
         mock_model.id = "gpt-4o-mini"
-        mock_openai.return_value.models.list.return_value = [mock_model]
+        mock_openai.return_value.with_options.return_value.models.list.return_value = [mock_model]
 
         # Create a mock response
         mock_completion = MagicMock()
@@ -86,7 +86,7 @@ class TestGPTChatbot:
         # Mock models list
         mock_model = MagicMock()
         mock_model.id = "gpt-4o-mini"
-        mock_openai.return_value.models.list.return_value = [mock_model]
+        mock_openai.return_value.with_options.return_value.models.list.return_value = [mock_model]
 
         """Test handling of empty responses from OpenAI API"""
         mock_completion = MagicMock()
@@ -0,0 +1,96 @@
+"""
+Test suite for the message formats and FormattedHistory cache.
+
+Tests that conversation messages are formatted incrementally as the
+conversation grows and formatted again when it is replaced.
+"""
+
+from typing import List
+
+from chatbot_conversation.models.messages import (
+    ChatMessage,
+    ConversationMessage,
+    FormattedHistory,
+    to_chat_message,
+)
+
+
+def test_to_chat_message() -> None:
+    """
+    Test that a bot's own messages are given the assistant role and all others user.
+    """
+    assert to_chat_message({"bot_index": 1, "content": "Mine"}, bot_index=1) == {
+        "role": "assistant",
+        "content": "Mine",
+    }
+    assert to_chat_message({"bot_index": 2, "content": "Theirs"}, bot_index=1) == {
+        "role": "user",
+        "content": "Theirs",
+    }
+
+
+def test_formatted_history_formats_only_new_messages() -> None:
+    """
+    Test that a grown conversation only formats the messages added since the last call.
+    """
+    formatted: List[ConversationMessage] = []
+
+    def format_message(message: ConversationMessage) -> ChatMessage:
+        formatted.append(message)
+        return to_chat_message(message, bot_index=1)
+
+    history: FormattedHistory[ChatMessage] = FormattedHistory()
+    conversation: List[ConversationMessage] = [{"bot_index": 0, "content": "Seed"}]
+    history.update(conversation, format_message)
+
+    conversation = conversation + [{"bot_index": 1, "content": "Reply"}]
+    messages = history.update(conversation, format_message)
+
+    assert formatted == conversation
+    assert messages == [
+        {"role": "user", "content": "Seed"},
+        {"role": "assistant", "content": "Reply"},
+    ]
+
+
+def test_formatted_history_reformats_replaced_conversation() -> None:
+    """
+    Test that a shorter conversation, or one with a different last cached message, is
+    formatted again from the start.
+    """
+    history: FormattedHistory[ChatMessage] = FormattedHistory()
+    conversation: List[ConversationMessage] = [
+        {"bot_index": 0, "content": "Seed"},
+        {"bot_index": 1, "content": "Reply"},
+    ]
+    history.update(conversation, lambda message: to_chat_message(message, bot_index=1))
+
+    shorter: List[ConversationMessage] = [{"bot_index": 0, "content": "Other seed"}]
+    assert history.update(shorter, lambda message: to_chat_message(message, bot_index=1)) == [
+        {"role": "user", "content": "Other seed"}
+    ]
+
+    changed: List[ConversationMessage] = [
+        {"bot_index": 0, "content": "Another seed"},
+        {"bot_index": 1, "content": "Reply"},
+    ]
+    assert history.update(changed, lambda message: to_chat_message(message, bot_index=1)) == [
+        {"role": "user", "content": "Another seed"},
+        {"role": "assistant", "content": "Reply"},
+    ]
+
+
+def test_formatted_history_clear() -> None:
+    """
+    Test that clearing the history discards all formatted messages.
+    """
+    history: FormattedHistory[ChatMessage] = FormattedHistory()
+    history.update(
+        [{"bot_index": 0, "content": "Seed"}],
+        lambda message: to_chat_message(message, bot_index=1),
+    )
+
+    history.clear()
+
+    assert not history.messages
+    assert history.last_source is None
@@ -5,6 +5,7 @@ import logging.config
 import os
 from pathlib import Path
 from typing import Any, Dict, Generator, List
+from unittest.mock import patch
 
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
@@ -32,6 +33,20 @@ def mock_env_keys(monkeypatch: MonkeyPatch) -> Dict[str, str]:
     return mock_keys
 
 
+@pytest.fixture
+def restore_environ() -> Generator[None, None, None]:
+    """Fixture to restore os.environ after a test that loads a .env file into it.
+
+    APIConfig writes .env variables straight into os.environ, which monkeypatch
+    does not undo for variables that did not exist before the test.
+
+    Yields:
+        None
+    """
+    with patch.dict(os.environ):
+        yield
+
+
 @pytest.fixture
 def temp_env_file(tmp_path: Path) -> Generator[str, None, None]:
     """Fixture to create a temporary .env file.
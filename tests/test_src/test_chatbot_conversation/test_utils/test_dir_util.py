@@ -13,7 +13,10 @@ from chatbot_conversation.utils.dir_util import (
     CONFIG_DIR_ENV_VAR,
     DEFAULT_CONFIG_DIR,
     DEFAULT_OUTPUT_DIR,
+    FILE_IN_PROJECT_ROOT,
     OUTPUT_DIR_ENV_VAR,
+    _find_project_roots,
+    clear_dir_caches,
     get_config_dir,
     get_output_dir,
     path_is_simple_filename,
@@ -112,6 +115,43 @@ def test_get_config_dir_no_create(monkeypatch: MonkeyPatch, temp_dir: Path) -> N
     assert not config_path.exists()
 
 
+def test_get_config_dir_cached(monkeypatch: MonkeyPatch, temp_project_root: Path) -> None:
+    """Test configuration directory lookup is cached per working directory.
+
+    Args:
+        monkeypatch: Fixture for modifying environment variables
+        temp_project_root: Fixture providing temporary project structure
+    """
+    monkeypatch.delenv(CONFIG_DIR_ENV_VAR, raising=False)
+    clear_dir_caches()
+
+    first = get_config_dir()
+    # Creating the config directory afterwards is not seen until the cache is cleared
+    (temp_project_root / DEFAULT_CONFIG_DIR).mkdir()
+    assert get_config_dir() == first == temp_project_root
+
+    clear_dir_caches()
+    assert _find_project_roots.cache_info().currsize == 0
+    assert get_config_dir() == temp_project_root / DEFAULT_CONFIG_DIR
+
+
+def test_find_project_roots_ignores_dangling_symlink(tmp_path: Path) -> None:
+    """Test a broken root marker symlink does not make its directory a project root.
+
+    Args:
+        tmp_path: PyTest's temporary path fixture
+    """
+    (tmp_path / FILE_IN_PROJECT_ROOT).symlink_to(tmp_path / "missing.toml")
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / FILE_IN_PROJECT_ROOT).touch()
+    clear_dir_caches()
+
+    roots = _find_project_roots(tmp_path / "nested", FILE_IN_PROJECT_ROOT)
+
+    assert tmp_path / "nested" in roots
+    assert tmp_path not in roots
+
+
 # Output directory tests
 def test_get_output_dir_from_env(monkeypatch: MonkeyPatch, temp_dir: Path) -> None:
     """Test output directory retrieval from environment variable.
@@ -27,6 +27,19 @@ def test_update_bot_config_success(temp_bot_config: str, capture_stdout: List[st
     assert f"All bots now have type: {new_type} and version: {new_version}" in capture_stdout
 
 
+def test_update_bot_config_no_change(temp_bot_config: str, capture_stdout: List[str]) -> None:
+    """Test config file is not rewritten when bots already match."""
+    config_path = Path(temp_bot_config)
+    original_text = config_path.read_text()
+    original_mtime = config_path.stat().st_mtime_ns
+
+    update_bot_config(temp_bot_config, "old_type", "old_version")
+
+    assert config_path.read_text() == original_text
+    assert config_path.stat().st_mtime_ns == original_mtime
+    assert f"No changes needed for {temp_bot_config}" in capture_stdout
+
+
 def test_update_bot_config_file_not_found(capture_stdout: List[str]) -> None:
     """Test handling of non-existent config file."""
     update_bot_config("nonexistent.json", "new_type", "new_version")
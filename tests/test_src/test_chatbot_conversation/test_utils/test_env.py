@@ -7,7 +7,7 @@ from pathlib import Path
 from _pytest.logging import LogCaptureFixture
 from _pytest.monkeypatch import MonkeyPatch
 
-from chatbot_conversation.utils.env import APIConfig
+from chatbot_conversation.utils.env import APIConfig, _read_dotenv
 from chatbot_conversation.utils.logging_util import LOGNAME_CONFIGURATION
 
 
@@ -75,6 +75,41 @@ GOOGLE_API_KEY=mock-google-key-12345678
     assert os.getenv("GOOGLE_API_KEY") == "mock-google-key-12345678"
 
 
+def test_load_config_cached_until_file_changes(
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+    restore_environ: None,
+) -> None:
+    """Test .env parsing is reused across calls and refreshed when the file changes.
+
+    Args:
+        monkeypatch: Fixture for mocking
+        tmp_path: PyTest's temporary path fixture
+        restore_environ: Fixture restoring os.environ after the test
+    """
+    env_file = tmp_path / ".env"
+    env_file.write_text("CACHED_API_KEY=first-value")
+
+    monkeypatch.setattr("pathlib.Path.cwd", lambda: tmp_path)
+    os.environ.pop("CACHED_API_KEY", None)
+
+    _read_dotenv.cache_clear()
+    APIConfig._load_config()
+    assert os.getenv("CACHED_API_KEY") == "first-value"
+
+    # Cached values are still applied to an environment that no longer has them
+    del os.environ["CACHED_API_KEY"]
+    APIConfig._load_config()
+    assert os.getenv("CACHED_API_KEY") == "first-value"
+    assert _read_dotenv.cache_info().hits == 1
+
+    # A changed file is parsed again
+    env_file.write_text("CACHED_API_KEY=second-value-longer")
+    del os.environ["CACHED_API_KEY"]
+    APIConfig._load_config()
+    assert os.getenv("CACHED_API_KEY") == "second-value-longer"
+
+
 def test_env_precedence(
     monkeypatch: MonkeyPatch,
     tmp_path: Path,
@@ -132,3 +167,52 @@ def test_custom_api_key(
 
     assert os.getenv("CUSTOM_API_KEY") == "test-value"
     assert "CUSTOM_API_KEY is set in environment" in caplog.text
+
+
+def test_api_keys_reported_without_scanning_environment(
+    monkeypatch: MonkeyPatch,
+    caplog: LogCaptureFixture,
+    mock_logging_config: None,
+    tmp_path: Path,
+) -> None:
+    """Test known API keys are reported but other keys only if defined in the .env file."""
+    caplog.set_level(logging.DEBUG)
+
+    # Set up the logger with caplog handler
+    test_logger = logging.getLogger(LOGNAME_CONFIGURATION)
+    test_logger.handlers = []
+    test_logger.addHandler(caplog.handler)
+    monkeypatch.setattr("chatbot_conversation.utils.env.logger", test_logger)
+
+    monkeypatch.setenv("GOOGLE_API_KEY", "google-value")
+    monkeypatch.setenv("SHELL_ONLY_API_KEY", "shell-value")
+    monkeypatch.setattr("pathlib.Path.cwd", lambda: tmp_path)
+
+    APIConfig.setup_env()
+
+    assert "GOOGLE_API_KEY is set in environment" in caplog.text
+    assert "SHELL_ONLY_API_KEY" not in caplog.text
+
+
+def test_load_config_does_not_interpolate(
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+    restore_environ: None,
+) -> None:
+    """Test .env values are loaded literally rather than expanded from the environment.
+
+    Args:
+        monkeypatch: Fixture for mocking
+        tmp_path: PyTest's temporary path fixture
+        restore_environ: Fixture restoring os.environ after the test
+    """
+    env_file = tmp_path / ".env"
+    env_file.write_text("INTERPOLATED_API_KEY=${KEY_SOURCE}")
+
+    monkeypatch.setattr("pathlib.Path.cwd", lambda: tmp_path)
+    os.environ.pop("INTERPOLATED_API_KEY", None)
+    os.environ["KEY_SOURCE"] = "source-value"
+
+    APIConfig._load_config()
+
+    assert os.getenv("INTERPOLATED_API_KEY") == "${KEY_SOURCE}"
@@ -0,0 +1,57 @@
+"""Unit tests for the chatbot exception classes."""
+
+import pickle
+
+import pytest
+
+from chatbot_conversation.utils import (
+    APIException,
+    ChatbotException,
+    ConfigurationException,
+    ErrorSeverity,
+    ModelException,
+    SystemException,
+    ValidationException,
+)
+
+
+@pytest.mark.parametrize(
+    "exception_class",
+    [
+        APIException,
+        ConfigurationException,
+        ModelException,
+        SystemException,
+        ValidationException,
+    ],
+)
+def test_exception_pickle_round_trip(exception_class: type[ChatbotException]) -> None:
+    """Test exceptions keep all their attributes when pickled, e.g. across processes."""
+    error = exception_class(
+        message="Technical message",
+        user_message="User message",
+        severity=ErrorSeverity.WARNING,
+        original_error=ValueError("cause"),
+    )
+
+    restored = pickle.loads(pickle.dumps(error))
+
+    assert type(restored) is exception_class
+    assert restored.message == "Technical message"
+    assert restored.user_message == "User message"
+    assert restored.severity is ErrorSeverity.WARNING
+    assert isinstance(restored.original_error, ValueError)
+    assert str(restored) == str(error)
+
+
+def test_base_exception_pickle_round_trip() -> None:
+    """Test the base exception, which has no argument defaults, can be unpickled."""
+    error = ChatbotException(
+        message="Technical message",
+        user_message="User message",
+        severity=ErrorSeverity.FATAL,
+    )
+
+    restored = pickle.loads(pickle.dumps(error))
+
+    assert repr(restored) == repr(error)